@@ -5,6 +5,7 @@ from pathlib import Path
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmapCache
 
 from .controllers.app_controller import AppController
 
@@ -25,6 +26,9 @@ def main() -> int:
     app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
     app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
 
+    # Room for scaled grid thumbnails shared between media cards (in KB)
+    QPixmapCache.setCacheLimit(65536)
+
     # Load stylesheet if available
     stylesheet_path = Path(__file__).parent / "resources" / "styles" / "main.qss"
     if not stylesheet_path.exists():
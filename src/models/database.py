@@ -7,6 +7,13 @@ from typing import Dict, List, Optional, Tuple
 
 from ..models.media_file import MediaFile, MediaType
 
+_INSERT_MEDIA_FILE = """
+    INSERT OR REPLACE INTO media_files
+    (file_path, file_name, file_type, file_size, duration, width, height,
+     date_modified, folder_path, thumbnail_path, inode, mtime_ns)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class Database:
     """SQLite database manager for media files."""
@@ -33,6 +40,10 @@ class Database:
                 str(self.db_path), check_same_thread=False
             )
             self.conn.row_factory = sqlite3.Row
+            # WAL with NORMAL sync only fsyncs at checkpoints, not per commit
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
         return self.conn
 
     def init_database(self) -> None:
@@ -56,11 +67,20 @@ class Database:
                 date_modified TIMESTAMP,
                 folder_path TEXT NOT NULL,
                 thumbnail_path TEXT,
+                inode INTEGER,
+                mtime_ns INTEGER,
                 UNIQUE(file_path)
             )
             """
         )
 
+        # Add the file identity columns to databases created before they existed
+        cursor.execute("PRAGMA table_info(media_files)")
+        columns = {row["name"] for row in cursor.fetchall()}
+        for column in ("inode", "mtime_ns"):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE media_files ADD COLUMN {column} INTEGER")
+
         # Create folders table
         cursor.execute(
             """
@@ -122,31 +142,68 @@ class Database:
         """
         conn = self._get_connection()
         cursor = conn.cursor()
+        cursor.execute(_INSERT_MEDIA_FILE, self._media_file_row(media_file))
+
+        conn.commit()
+        return cursor.lastrowid
+
+    def add_media_files(self, media_files: List[MediaFile]) -> int:
+        """Add several media files to the database in one transaction.
+
+        Args:
+            media_files: MediaFile instances to add
 
+        Returns:
+            Number of records written
+        """
+        conn = self._get_connection()
+        with conn:  # Commits once at the end, rolls back on error
+            conn.executemany(
+                _INSERT_MEDIA_FILE,
+                [self._media_file_row(media_file) for media_file in media_files],
+            )
+        return len(media_files)
+
+    @staticmethod
+    def _media_file_row(media_file: MediaFile) -> Tuple:
+        """Build the insert parameters for a media file.
+
+        Args:
+            media_file: MediaFile instance
+
+        Returns:
+            Values in _INSERT_MEDIA_FILE column order
+        """
         data = media_file.to_dict()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO media_files
-            (file_path, file_name, file_type, file_size, duration, width, height,
-             date_modified, folder_path, thumbnail_path)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["file_path"],
-                data["file_name"],
-                data["file_type"],
-                data["file_size"],
-                data["duration"],
-                data["width"],
-                data["height"],
-                datetime.now().timestamp(),
-                data["folder_path"],
-                data["thumbnail_path"],
-            ),
+        return (
+            data["file_path"],
+            data["file_name"],
+            data["file_type"],
+            data["file_size"],
+            data["duration"],
+            data["width"],
+            data["height"],
+            datetime.now().timestamp(),
+            data["folder_path"],
+            data["thumbnail_path"],
+            data["inode"],
+            data["mtime_ns"],
         )
 
-        conn.commit()
-        return cursor.lastrowid
+    def get_file_signatures(self) -> Dict[str, Tuple[int, int]]:
+        """Get the recorded identity of every media file.
+
+        Returns:
+            Dictionary mapping file_path to (inode, mtime_ns), for files
+            stored with both values
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT file_path, inode, mtime_ns FROM media_files "
+            "WHERE inode IS NOT NULL AND mtime_ns IS NOT NULL"
+        )
+        return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
 
     def get_media_files(
         self,
@@ -188,9 +245,10 @@ class Database:
 
         query += " ORDER BY file_name ASC"
 
-        if limit:
+        # SQLite only accepts OFFSET after LIMIT; -1 means no limit
+        if limit or offset:
             query += " LIMIT ?"
-            params.append(limit)
+            params.append(limit or -1)
 
         if offset:
             query += " OFFSET ?"
@@ -460,9 +518,10 @@ class Database:
 
         query += " ORDER BY file_name ASC"
 
-        if limit:
+        # SQLite only accepts OFFSET after LIMIT; -1 means no limit
+        if limit or offset:
             query += " LIMIT ?"
-            params.append(limit)
+            params.append(limit or -1)
 
         if offset:
             query += " OFFSET ?"
@@ -28,6 +28,8 @@ class MediaFile:
         height: Optional[int] = None,
         folder_path: Optional[str] = None,
         thumbnail_path: Optional[str] = None,
+        inode: Optional[int] = None,
+        mtime_ns: Optional[int] = None,
     ):
         """Initialize a MediaFile instance.
 
@@ -41,6 +43,8 @@ class MediaFile:
             height: Height in pixels (for video/image)
             folder_path: Path to the containing folder
             thumbnail_path: Path to thumbnail image
+            inode: Inode number when the file was scanned
+            mtime_ns: Modification time in nanoseconds when the file was scanned
         """
         self.file_path = str(Path(file_path).resolve())
         self.file_name = file_name or Path(file_path).name
@@ -51,6 +55,8 @@ class MediaFile:
         self.height = height
         self.folder_path = folder_path or str(Path(file_path).parent)
         self.thumbnail_path = thumbnail_path
+        self.inode = inode
+        self.mtime_ns = mtime_ns
 
     @staticmethod
     def _detect_type(file_path: str) -> MediaType:
@@ -110,6 +116,8 @@ class MediaFile:
             "height": self.height,
             "folder_path": self.folder_path,
             "thumbnail_path": self.thumbnail_path,
+            "inode": self.inode,
+            "mtime_ns": self.mtime_ns,
         }
 
     @classmethod
@@ -133,6 +141,8 @@ class MediaFile:
             height=data.get("height"),
             folder_path=data.get("folder_path"),
             thumbnail_path=data.get("thumbnail_path"),
+            inode=data.get("inode"),
+            mtime_ns=data.get("mtime_ns"),
         )
 
     def __repr__(self) -> str:
@@ -1,9 +1,10 @@
 """Media scanner for recursively scanning folders for media files."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Thread
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from ..models.database import Database
 from ..models.media_file import MediaFile
@@ -20,6 +21,8 @@ from ..utils.file_utils import (
 class MediaScanner(Thread):
     """Thread-based media scanner for recursive folder scanning."""
 
+    BATCH_SIZE = 500  # Media files saved per database transaction
+
     def __init__(
         self,
         folder_paths: List[str],
@@ -60,28 +63,28 @@ class MediaScanner(Thread):
         if not folder_path.exists() or not folder_path.is_dir():
             return media_files
 
-        try:
-            for root, dirs, files in os.walk(folder_path):
-                if self._stop_requested:
-                    break
-
-                # Skip hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-                for file in files:
-                    if self._stop_requested:
-                        break
-
-                    file_path = Path(root) / file
-                    if is_media_file(str(file_path)):
-                        media_files.append(file_path)
-
-        except PermissionError:
-            # Skip folders without permission
-            pass
-        except Exception:
-            # Continue on other errors
-            pass
+        # Walk with scandir: entry types come from the directory listing itself,
+        # so only the (few) media files are ever turned into Path objects
+        pending = [str(folder_path)]
+        while pending and not self._stop_requested:
+            directory = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        # Skip hidden directories
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith("."):
+                                subdirs.append(entry.path)
+                        elif is_media_file(name) and entry.is_file():
+                            media_files.append(Path(entry.path))
+            except OSError:
+                # Skip folders without permission or that vanished mid-scan
+                continue
+
+            # Visit subfolders in listing order, depth first
+            pending.extend(reversed(subdirs))
 
         return media_files
 
@@ -102,6 +105,8 @@ class MediaScanner(Thread):
             # Get basic metadata
             metadata = get_file_metadata(str(file_path))
             file_size = metadata.get("file_size")
+            inode = metadata.get("inode")
+            mtime_ns = metadata.get("mtime_ns")
 
             # Get type-specific metadata
             duration = None
@@ -140,16 +145,66 @@ class MediaScanner(Thread):
                 width=width,
                 height=height,
                 folder_path=str(file_path.parent),
+                inode=inode,
+                mtime_ns=mtime_ns,
             )
 
         except Exception:
             return None
 
+    @staticmethod
+    def _is_unchanged(file_path: Path, known: Dict[str, Tuple[int, int]]) -> bool:
+        """Check if a file is stored with its current inode and mtime.
+
+        Args:
+            file_path: Path to media file
+            known: file_path -> (inode, mtime_ns) from the database
+
+        Returns:
+            True if the stored record is still current
+        """
+        signature = known.get(str(file_path))
+        if signature is None:
+            # Stored paths are resolved (see MediaFile), so a symlinked file is
+            # only found under its target's path
+            signature = known.get(str(file_path.resolve()))
+            if signature is None:
+                return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return signature == (stat.st_ino, stat.st_mtime_ns)
+
+    def _save_batch(self, media_files: List[MediaFile]) -> int:
+        """Save a batch of media files to the database.
+
+        Args:
+            media_files: Processed media files
+
+        Returns:
+            Number of files saved
+        """
+        try:
+            return self.database.add_media_files(media_files)
+        except Exception:
+            pass
+
+        # The batch was rolled back; save one by one to skip only the bad files
+        saved = 0
+        for media_file in media_files:
+            try:
+                self.database.add_media_file(media_file)
+                saved += 1
+            except Exception:
+                # Skip files that can't be added (e.g., duplicates)
+                pass
+        return saved
+
     def run(self) -> None:
         """Run the scanner in a separate thread."""
         all_media_files = []
 
-        # First pass: collect all media files
         for folder_path in self.folder_paths:
             if self._stop_requested:
                 break
@@ -157,33 +212,66 @@ class MediaScanner(Thread):
             # Add folder to database
             self.database.add_folder(str(folder_path))
 
-            # Scan folder
-            media_files = self._scan_folder(folder_path)
-            all_media_files.extend(media_files)
+        # First pass: collect all media files. Folders are walked concurrently
+        # (directory listing is I/O bound); results come back in folder order
+        # and are saved from this thread
+        workers = min(len(self.folder_paths), os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for folder_path in self.folder_paths:
+                    if self._stop_requested:
+                        break
+                    futures.append(executor.submit(self._scan_folder, folder_path))
+                for future in futures:
+                    all_media_files.extend(future.result())
+        else:
+            for folder_path in self.folder_paths:
+                if self._stop_requested:
+                    break
+                all_media_files.extend(self._scan_folder(folder_path))
 
         total_files = len(all_media_files)
         processed = 0
-
-        # Second pass: process and save to database
+        # Files already stored and untouched since are kept without re-probing
+        known = self.database.get_file_signatures()
+        changed: List[Path] = []
         for file_path in all_media_files:
             if self._stop_requested:
                 break
+            if self._is_unchanged(file_path, known):
+                processed += 1
+            else:
+                changed.append(file_path)
+
+        # Second pass: probe files in parallel (mostly file I/O and native
+        # decoders) and save each batch from this thread in one transaction
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        try:
+            for start in range(0, len(changed), self.BATCH_SIZE):
+                if self._stop_requested:
+                    break
+
+                chunk = changed[start:start + self.BATCH_SIZE]
+                batch: List[MediaFile] = []
+                results = executor.map(self._process_media_file, chunk)
+                for file_path, media_file in zip(chunk, results):
+                    if self._stop_requested:
+                        break
+
+                    # Update progress
+                    if self.progress_callback:
+                        self.progress_callback(
+                            processed + len(batch), total_files, str(file_path)
+                        )
+
+                    if media_file:
+                        batch.append(media_file)
 
-            # Update progress
-            if self.progress_callback:
-                self.progress_callback(
-                    processed, total_files, str(file_path)
-                )
-
-            # Process file
-            media_file = self._process_media_file(file_path)
-            if media_file:
-                try:
-                    self.database.add_media_file(media_file)
-                    processed += 1
-                except Exception:
-                    # Skip files that can't be added (e.g., duplicates)
-                    pass
+                if batch:
+                    processed += self._save_batch(batch)
+        finally:
+            executor.shutdown(cancel_futures=True)
 
         # Final progress update
         if self.progress_callback:
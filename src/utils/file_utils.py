@@ -3,24 +3,72 @@
 import contextlib
 import os
 import sys
-from pathlib import Path
+import threading
 from typing import Dict, List, Optional, Tuple
 
 
+_quiet_lock = threading.Lock()  # Guards the process-wide output state below
+_stderr_depth = 0  # Number of active suppress_stderr() blocks, across threads
+_saved_stderr = None
+_cv2_depth = 0  # Number of active suppress_cv2_output() blocks, across threads
+_saved_cv2_log_level = None
+
+
 @contextlib.contextmanager
 def suppress_stderr():
     """Temporarily suppress stderr to hide FFmpeg/AV1 error messages.
-    
+
+    Safe to use from several threads at once: the first active block swaps
+    stderr out and the last one to exit restores it.
+
+    Yields:
+        None
+    """
+    global _stderr_depth, _saved_stderr
+    with _quiet_lock:
+        if _stderr_depth == 0:
+            _saved_stderr = sys.stderr
+            sys.stderr = open(os.devnull, 'w')
+        _stderr_depth += 1
+    try:
+        yield
+    finally:
+        with _quiet_lock:
+            _stderr_depth -= 1
+            if _stderr_depth == 0:
+                sys.stderr.close()
+                sys.stderr = _saved_stderr
+                _saved_stderr = None
+
+
+@contextlib.contextmanager
+def suppress_cv2_output(cv2):
+    """Silence OpenCV logging and stderr to hide FFmpeg/AV1 messages.
+
+    Like suppress_stderr(), safe to use from several threads at once: the
+    first active block lowers the log level and the last one restores it.
+
+    Args:
+        cv2: The imported OpenCV module
+
     Yields:
         None
     """
-    with open(os.devnull, 'w') as devnull:
-        old_stderr = sys.stderr
-        sys.stderr = devnull
-        try:
+    global _cv2_depth, _saved_cv2_log_level
+    with _quiet_lock:
+        if _cv2_depth == 0:
+            _saved_cv2_log_level = cv2.getLogLevel()
+            cv2.setLogLevel(0)  # SILENT
+        _cv2_depth += 1
+    try:
+        with suppress_stderr():
             yield
-        finally:
-            sys.stderr = old_stderr
+    finally:
+        with _quiet_lock:
+            _cv2_depth -= 1
+            if _cv2_depth == 0:
+                cv2.setLogLevel(_saved_cv2_log_level)
+                _saved_cv2_log_level = None
 
 
 def get_media_extensions() -> Dict[str, List[str]]:
@@ -70,8 +118,18 @@ def get_media_extensions() -> Dict[str, List[str]]:
     }
 
 
+# Extension -> media type, built once so lookups are a single dict access
+_EXT_TO_TYPE: Dict[str, str] = {
+    ext: media_type
+    for media_type, extensions in get_media_extensions().items()
+    for ext in extensions
+}
+
+
 def is_media_file(file_path: str) -> bool:
-    """Check if a file is a supported media file.
+    """Check if a file has a supported media extension.
+
+    Only the name is checked; the file doesn't need to exist.
 
     Args:
         file_path: Path to the file
@@ -79,16 +137,7 @@ def is_media_file(file_path: str) -> bool:
     Returns:
         True if file is a supported media type, False otherwise
     """
-    path = Path(file_path)
-    if not path.is_file():
-        return False
-
-    ext = path.suffix.lower()
-    extensions = get_media_extensions()
-    all_extensions = [
-        ext for extensions_list in extensions.values() for ext in extensions_list
-    ]
-    return ext in all_extensions
+    return get_file_type(file_path) is not None
 
 
 def get_file_type(file_path: str) -> Optional[str]:
@@ -100,14 +149,7 @@ def get_file_type(file_path: str) -> Optional[str]:
     Returns:
         Media type string ('video', 'audio', 'image', 'document') or None
     """
-    ext = Path(file_path).suffix.lower()
-    extensions = get_media_extensions()
-
-    for media_type, ext_list in extensions.items():
-        if ext in ext_list:
-            return media_type
-
-    return None
+    return _EXT_TO_TYPE.get(os.path.splitext(file_path)[1].lower())
 
 
 def get_file_metadata(file_path: str) -> Dict[str, any]:
@@ -117,16 +159,19 @@ def get_file_metadata(file_path: str) -> Dict[str, any]:
         file_path: Path to the file
 
     Returns:
-        Dictionary with file metadata (size, date_modified)
+        Dictionary with file metadata (size, date_modified, inode, mtime_ns)
     """
-    path = Path(file_path)
-    if not path.exists():
+    # A single stat call: a missing file raises instead of being checked first
+    try:
+        stat = os.stat(file_path)
+    except OSError:
         return {}
 
-    stat = path.stat()
     return {
         "file_size": stat.st_size,
         "date_modified": stat.st_mtime,
+        "inode": stat.st_ino,
+        "mtime_ns": stat.st_mtime_ns,
     }
 
 
@@ -154,13 +199,9 @@ def get_file_duration(file_path: str) -> Optional[float]:
             import cv2
 
             cap = None
-            # Suppress OpenCV logging to hide FFmpeg/AV1 warnings
-            old_log_level = cv2.getLogLevel()
-            cv2.setLogLevel(0)  # Set to SILENT to suppress all OpenCV/FFmpeg messages
-
             try:
-                # Suppress stderr to hide FFmpeg/AV1 error messages (additional layer)
-                with suppress_stderr():
+                # Silence OpenCV logging and stderr to hide FFmpeg/AV1 messages
+                with suppress_cv2_output(cv2):
                     cap = cv2.VideoCapture(file_path)
                     if not cap.isOpened():
                         return None
@@ -179,8 +220,6 @@ def get_file_duration(file_path: str) -> Optional[float]:
                 # Handle AV1 codec errors, missing headers, or memory issues
                 return None
             finally:
-                # Restore original OpenCV log level
-                cv2.setLogLevel(old_log_level)
                 if cap is not None:
                     try:
                         cap.release()
@@ -231,30 +270,22 @@ def get_video_dimensions(file_path: str) -> Optional[Tuple[int, int]]:
     try:
         import cv2
 
-        # Suppress OpenCV logging to hide FFmpeg/AV1 warnings
-        old_log_level = cv2.getLogLevel()
-        cv2.setLogLevel(0)  # Set to SILENT to suppress all OpenCV/FFmpeg messages
-
-        try:
-            # Suppress stderr to hide FFmpeg/AV1 error messages (additional layer)
-            with suppress_stderr():
-                cap = cv2.VideoCapture(file_path)
-                if not cap.isOpened():
-                    return None
-
-                # Handle potential AV1/codec errors
-                try:
-                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                except (ValueError, OverflowError):
-                    # AV1 or other codec issues may cause invalid values
-                    return None
-
-                if width > 0 and height > 0:
-                    return (width, height)
-        finally:
-            # Restore original OpenCV log level
-            cv2.setLogLevel(old_log_level)
+        # Silence OpenCV logging and stderr to hide FFmpeg/AV1 messages
+        with suppress_cv2_output(cv2):
+            cap = cv2.VideoCapture(file_path)
+            if not cap.isOpened():
+                return None
+
+            # Handle potential AV1/codec errors
+            try:
+                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            except (ValueError, OverflowError):
+                # AV1 or other codec issues may cause invalid values
+                return None
+
+            if width > 0 and height > 0:
+                return (width, height)
     except (OSError, IOError, MemoryError):
         # Handle AV1 codec errors, missing headers, or memory issues
         return None
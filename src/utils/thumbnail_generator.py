@@ -1,29 +1,19 @@
 """Thumbnail generator for various media types."""
 
-import contextlib
 import hashlib
 import os
-import sys
 from pathlib import Path
 from typing import Optional, Tuple
 
 from PIL import Image
 
+from .file_utils import suppress_cv2_output
 
-@contextlib.contextmanager
-def suppress_stderr():
-    """Temporarily suppress stderr to hide FFmpeg/AV1 error messages.
-    
-    Yields:
-        None
-    """
-    with open(os.devnull, 'w') as devnull:
-        old_stderr = sys.stderr
-        sys.stderr = devnull
-        try:
-            yield
-        finally:
-            sys.stderr = old_stderr
+try:
+    import pyvips as _pyvips
+except Exception:
+    # pyvips missing, or installed without the libvips library
+    _pyvips = None
 
 
 class ThumbnailGenerator:
@@ -53,6 +43,46 @@ class ThumbnailGenerator:
         file_hash = hashlib.md5(file_path.encode()).hexdigest()
         return self.cache_dir / f"{file_hash}.jpg"
 
+    @staticmethod
+    def _file_identity(file_path: str) -> Optional[str]:
+        """Get a file's (inode, mtime, size) identity as a string.
+
+        Args:
+            file_path: Path to the media file
+
+        Returns:
+            "inode mtime_ns size", or None if the file can't be stat'ed
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{stat.st_ino} {stat.st_mtime_ns} {stat.st_size}"
+
+    @staticmethod
+    def _is_fresh(identity: Optional[str], cache_path: Path) -> bool:
+        """Check if a cached thumbnail was made from the file as it is now.
+
+        The source's identity is stored next to the thumbnail when it's
+        written and must match exactly, so a file replaced by an older copy
+        (or one dated ahead of the local clock) is handled like any edit.
+
+        Args:
+            identity: Current identity of the media file (see _file_identity)
+            cache_path: Path to its cached thumbnail
+
+        Returns:
+            True if the cached thumbnail exists and is up to date
+        """
+        if identity is None:
+            # Source unreadable: the cached thumbnail is all there is
+            return cache_path.exists()
+        try:
+            stored = cache_path.with_suffix(".id").read_text()
+        except OSError:
+            return False
+        return stored == identity and cache_path.exists()
+
     def generate_thumbnail(
         self, file_path: str, file_type: str, force_regenerate: bool = False
     ) -> Optional[str]:
@@ -67,9 +97,16 @@ class ThumbnailGenerator:
             Path to thumbnail file or None if generation failed
         """
         cache_path = self._get_cache_path(file_path)
+        # Taken before generating, so a file changed meanwhile is redone next time
+        identity = self._file_identity(file_path)
 
-        # Return cached thumbnail if exists and not forcing regeneration
-        if cache_path.exists() and not force_regenerate:
+        # Return cached thumbnail if up to date and not forcing regeneration
+        if not force_regenerate and self._is_fresh(identity, cache_path):
+            return str(cache_path)
+
+        # libvips shrinks while decoding, so images skip the PIL path when it's available
+        if file_type == "image" and self._save_image_thumbnail_vips(file_path, cache_path):
+            self._save_identity(identity, cache_path)
             return str(cache_path)
 
         try:
@@ -88,6 +125,7 @@ class ThumbnailGenerator:
                 # Save thumbnail
                 thumbnail.thumbnail(self.size, Image.Resampling.LANCZOS)
                 thumbnail.save(cache_path, "JPEG", quality=85)
+                self._save_identity(identity, cache_path)
                 return str(cache_path)
 
         except Exception:
@@ -95,6 +133,21 @@ class ThumbnailGenerator:
 
         return None
 
+    @staticmethod
+    def _save_identity(identity: Optional[str], cache_path: Path) -> None:
+        """Store the source identity a thumbnail was made from next to it.
+
+        Args:
+            identity: Identity of the media file (see _file_identity)
+            cache_path: Path to the thumbnail just written
+        """
+        if identity is None:
+            return
+        try:
+            cache_path.with_suffix(".id").write_text(identity)
+        except OSError:
+            pass  # The thumbnail is still good; it's just regenerated next time
+
     def _generate_video_thumbnail(self, file_path: str) -> Optional[Image.Image]:
         """Generate thumbnail from video file.
 
@@ -108,52 +161,42 @@ class ThumbnailGenerator:
         try:
             import cv2
 
-            # Suppress OpenCV logging to hide FFmpeg/AV1 warnings
-            # OpenCV uses different log levels: 0=SILENT, 1=FATAL, 2=ERROR, 3=WARN, 4=INFO, 5=DEBUG, 6=VERBOSE
-            old_log_level = cv2.getLogLevel()
-            cv2.setLogLevel(0)  # Set to SILENT to suppress all OpenCV/FFmpeg messages
-
-            try:
-                # Suppress stderr to hide FFmpeg/AV1 error messages (additional layer)
-                with suppress_stderr():
-                    # Try to open video file
-                    cap = cv2.VideoCapture(file_path)
-                    if not cap.isOpened():
-                        return None
+            # Silence OpenCV logging and stderr to hide FFmpeg/AV1 messages
+            with suppress_cv2_output(cv2):
+                # Try to open video file
+                cap = cv2.VideoCapture(file_path)
+                if not cap.isOpened():
+                    return None
 
-                    # Get total frames - handle potential AV1/codec errors
-                    try:
-                        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                    except (ValueError, OverflowError):
-                        # AV1 or other codec issues may cause invalid frame counts
-                        return None
+                # Get total frames - handle potential AV1/codec errors
+                try:
+                    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                except (ValueError, OverflowError):
+                    # AV1 or other codec issues may cause invalid frame counts
+                    return None
 
-                    if total_frames <= 0:
-                        return None
+                if total_frames <= 0:
+                    return None
+
+                # Seek to 25% of video, but try first frame if seek fails
+                target_frame = max(0, int(total_frames * 0.25))
+                try:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+                except Exception:
+                    # If seek fails, try first frame
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+                # Read frame with timeout handling
+                ret, frame = cap.read()
 
-                    # Seek to 25% of video, but try first frame if seek fails
-                    target_frame = max(0, int(total_frames * 0.25))
+                if ret and frame is not None and frame.size > 0:
+                    # Convert BGR to RGB
                     try:
-                        cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        return Image.fromarray(frame_rgb)
                     except Exception:
-                        # If seek fails, try first frame
-                        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-
-                    # Read frame with timeout handling
-                    ret, frame = cap.read()
-
-                    if ret and frame is not None and frame.size > 0:
-                        # Convert BGR to RGB
-                        try:
-                            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                            return Image.fromarray(frame_rgb)
-                        except Exception:
-                            # Color conversion failed
-                            return None
-            finally:
-                # Restore original OpenCV log level
-                cv2.setLogLevel(old_log_level)
-
+                        # Color conversion failed
+                        return None
         except (OSError, IOError, MemoryError) as e:
             # Handle AV1 codec errors, missing headers, or memory issues
             # These are often the cause of "AV1 missing header" errors
@@ -171,6 +214,32 @@ class ThumbnailGenerator:
 
         return None
 
+    def _save_image_thumbnail_vips(self, file_path: str, cache_path: Path) -> bool:
+        """Write an image's thumbnail with libvips, if pyvips is available.
+
+        Args:
+            file_path: Path to image file
+            cache_path: Where to write the JPEG thumbnail
+
+        Returns:
+            True if the thumbnail was written, False to fall back to PIL
+        """
+        if _pyvips is None:
+            return False
+
+        try:
+            img = _pyvips.Image.thumbnail(
+                file_path, self.size[0], height=self.size[1], size="down"
+            )
+            # Flatten transparency onto white, as the PIL path does; one
+            # background value per colour band (1 for grey, 3 for RGB)
+            if img.hasalpha():
+                img = img.flatten(background=[255] * (img.bands - 1))
+            img.write_to_file(str(cache_path), Q=85)
+            return True
+        except Exception:
+            return False
+
     def _generate_image_thumbnail(self, file_path: str) -> Optional[Image.Image]:
         """Generate thumbnail from image file.
 
@@ -248,16 +317,16 @@ class ThumbnailGenerator:
         return img
 
     def get_thumbnail_path(self, file_path: str) -> Optional[str]:
-        """Get thumbnail path if it exists in cache.
+        """Get thumbnail path if an up-to-date one exists in cache.
 
         Args:
             file_path: Path to the media file
 
         Returns:
-            Path to thumbnail or None if not found
+            Path to thumbnail or None if not found or stale
         """
         cache_path = self._get_cache_path(file_path)
-        if cache_path.exists():
+        if self._is_fresh(self._file_identity(file_path), cache_path):
             return str(cache_path)
         return None
 
@@ -1,77 +1,93 @@
-"""Asynchronous thumbnail generation worker thread."""
+"""Asynchronous thumbnail generation tasks for Qt thread pools."""
 
-from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import Qt, QObject, QSize, Signal
+from PySide6.QtGui import QImage
 
 from .thumbnail_generator import ThumbnailGenerator
 
 
-class ThumbnailWorker(QThread):
-    """Worker thread for generating thumbnails asynchronously."""
+class ThumbnailSignals(QObject):
+    """Signals for ThumbnailTask (a plain callable cannot emit signals itself)."""
 
-    thumbnail_ready = Signal(str, str)  # Emits (file_path, thumbnail_path) when ready
+    # Emits (file_path, thumbnail_path, image) when ready; image is the decoded
+    # (and scaled) thumbnail, null if it couldn't be decoded
+    thumbnail_ready = Signal(str, str, QImage)
     thumbnail_failed = Signal(str)  # Emits file_path when generation fails
+    finished = Signal(str)  # Emits file_path when the task is done, whatever the outcome
 
-    def __init__(self, file_path: str, file_type: str, thumbnail_generator: ThumbnailGenerator, parent=None):
-        """Initialize thumbnail worker.
+
+class ThumbnailTask:
+    """Thread pool task for generating a thumbnail asynchronously.
+
+    The task is submitted as a callable (``pool.start(task.run)``) rather than
+    as a QRunnable: PySide's ``QThreadPool.start(QRunnable)`` can hold on to
+    the Python runnable for the pool's lifetime, while the callable is
+    released as soon as it has run.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        file_type: str,
+        thumbnail_generator: ThumbnailGenerator,
+        scale_to: Optional[QSize] = None,
+    ):
+        """Initialize thumbnail task.
 
         Args:
             file_path: Path to media file
             file_type: Type of media ('video', 'audio', 'image', 'document')
             thumbnail_generator: ThumbnailGenerator instance
-            parent: Parent QObject
+            scale_to: Size to fit the decoded image into (keeping aspect ratio)
         """
-        super().__init__(parent)
         self.file_path = file_path
         self.file_type = file_type
         self.thumbnail_generator = thumbnail_generator
-        self._cancelled = False
+        self.scale_to = scale_to
+        self.signals = ThumbnailSignals()
+        self.cancelled = False
 
     def cancel(self) -> None:
-        """Cancel thumbnail generation."""
-        self._cancelled = True
-        if self.isRunning():
-            self.quit()  # Request thread to exit
-
-    def cleanup(self) -> None:
-        """Cleanup worker thread.
-        
-        This should be called before destroying the worker to ensure
-        the thread is properly terminated.
+        """Cancel thumbnail generation.
+
+        A task that has not started yet returns immediately when it runs;
+        a running task finishes but doesn't report a result. Either way it
+        still emits `finished`.
         """
-        self.cancel()
-        if self.isRunning():
-            # Wait up to 1 second for thread to finish
-            if not self.wait(1000):
-                # If thread is still running, force terminate
-                self.terminate()
-                self.wait(500)  # Wait a bit more after termination
+        self.cancelled = True
 
     def run(self) -> None:
-        """Generate thumbnail in background thread."""
-        if self._cancelled:
-            return
-
+        """Generate thumbnail in a pool thread."""
         try:
-            # Check if thumbnail already exists in cache
-            cache_path = self.thumbnail_generator.get_thumbnail_path(self.file_path)
-            if cache_path:
-                if not self._cancelled:
-                    self.thumbnail_ready.emit(self.file_path, cache_path)
+            if self.cancelled:
                 return
 
-            # Generate thumbnail
+            # Returns the cached thumbnail if it's up to date, generates it otherwise
             thumbnail_path = self.thumbnail_generator.generate_thumbnail(
                 self.file_path, self.file_type
             )
 
-            if not self._cancelled:
-                if thumbnail_path:
-                    self.thumbnail_ready.emit(self.file_path, thumbnail_path)
-                else:
-                    self.thumbnail_failed.emit(self.file_path)
+            if self.cancelled:
+                return
+            if not thumbnail_path:
+                self.signals.thumbnail_failed.emit(self.file_path)
+                return
+
+            # Decode (and scale) here so the UI thread only converts to a pixmap
+            image = QImage(thumbnail_path)
+            if self.scale_to is not None and not image.isNull():
+                image = image.scaled(
+                    self.scale_to,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+
+            if not self.cancelled:
+                self.signals.thumbnail_ready.emit(self.file_path, thumbnail_path, image)
         except Exception:
-            if not self._cancelled:
-                self.thumbnail_failed.emit(self.file_path)
+            if not self.cancelled:
+                self.signals.thumbnail_failed.emit(self.file_path)
+        finally:
+            self.signals.finished.emit(self.file_path)
@@ -1,9 +1,9 @@
 """Main window for the media center application."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeySequence, QShortcut, QKeyEvent
+from PySide6.QtCore import Qt, QUrl
+from PySide6.QtGui import QDesktopServices, QKeySequence, QShortcut, QKeyEvent
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -13,10 +13,42 @@ from PySide6.QtWidgets import (
     QPushButton,
     QMenuBar,
     QMenu,
+    QMessageBox,
 )
 
+from ..version import get_version
 from .media_grid import MediaGrid
 from .category_panel import CategoryPanel
+from .shortcuts_dialog import ShortcutsDialog
+
+
+# Key codes used on every key press, bound once at import
+_K_UP = Qt.Key.Key_Up
+_K_DOWN = Qt.Key.Key_Down
+_K_LEFT = Qt.Key.Key_Left
+_K_RIGHT = Qt.Key.Key_Right
+_K_RETURN = Qt.Key.Key_Return
+_K_ENTER = Qt.Key.Key_Enter
+_K_C = Qt.Key.Key_C
+_K_G = Qt.Key.Key_G
+_ARROWS = frozenset((_K_UP, _K_DOWN, _K_LEFT, _K_RIGHT))
+
+# Static dialog texts (the about text is formatted once with the version)
+_ABOUT_TITLE = "About Videoteka Media Center"
+_ABOUT_TEXT = (
+    "Videoteka Media Center v{version}\n\n"
+    "A modern desktop media center application for Linux\n"
+    "with streaming-style interface.\n\n"
+    "Author: Vinícius Gregório\n"
+    "GitHub: https://github.com/vncgregorio/videoteka-media-center\n\n"
+    "Built with PySide6, Pillow, and OpenCV\n\n"
+    "Licensed under GPLv3"
+)
+_MANAGE_TITLE = "Manage Library"
+_MANAGE_CONFIRM_TEXT = (
+    "This action will clear the entire current library and rescan the selected folders.\n\n"
+    "Do you want to continue?"
+)
 
 
 class MainWindow(QMainWindow):
@@ -32,6 +64,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Videoteka Media Center")
         self.setMinimumSize(1200, 800)
         self.controller = None  # Will be set by AppController
+        self._about_text: Optional[str] = None  # Formatted lazily on first use
 
         self._setup_ui()
         self._setup_shortcuts()
@@ -140,10 +173,10 @@ class MainWindow(QMainWindow):
         Returns:
             True if handled
         """
-        if key == Qt.Key.Key_Down:
+        if key == _K_DOWN:
             self.category_panel.focus_next()
             return True
-        elif key == Qt.Key.Key_Up:
+        elif key == _K_UP:
             self.category_panel.focus_previous()
             return True
         return False
@@ -162,7 +195,7 @@ class MainWindow(QMainWindow):
             return False  # Let MediaGrid process it
         
         # Otherwise, navigate grid directly
-        if not self.media_grid.all_media_files:
+        if not self.media_grid.file_paths:
             return False
         
         # Ensure a media item has focus before navigating
@@ -172,13 +205,13 @@ class MainWindow(QMainWindow):
         
         # Navigate grid
         handled = False
-        if key == Qt.Key.Key_Right:
+        if key == _K_RIGHT:
             handled = self.media_grid.focus_right()
-        elif key == Qt.Key.Key_Left:
+        elif key == _K_LEFT:
             handled = self.media_grid.focus_left()
-        elif key == Qt.Key.Key_Down:
+        elif key == _K_DOWN:
             handled = self.media_grid.focus_down()
-        elif key == Qt.Key.Key_Up:
+        elif key == _K_UP:
             handled = self.media_grid.focus_up()
         
         return handled
@@ -188,17 +221,17 @@ class MainWindow(QMainWindow):
         key = event.key()
         
         # C, G - Always work, regardless of focus
-        if key == Qt.Key.Key_C:
+        if key == _K_C:
             self._focus_categories()
             event.accept()
             return
-        elif key == Qt.Key.Key_G:
+        elif key == _K_G:
             self._focus_grid()
             event.accept()
             return
         
         # Arrow keys - process based on current focus
-        if key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right):
+        if key in _ARROWS:
             focus_target = self._get_current_focus_target()
             
             if focus_target == 'categories':
@@ -221,7 +254,7 @@ class MainWindow(QMainWindow):
                     return
         
         # Enter key - handle based on focus
-        elif key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
+        elif key == _K_RETURN or key == _K_ENTER:
             if self._has_categories_focus():
                 self.category_panel.activate_current_category()
                 event.accept()
@@ -256,20 +289,24 @@ class MainWindow(QMainWindow):
         """Handle escape key."""
         # If categories have focus, return focus to grid
         if self._has_categories_focus():
-            if self.media_grid.all_media_files:
+            if self.media_grid.file_paths:
                 self.media_grid.focus_first()
 
     def _focus_categories(self) -> None:
         """Focus the categories panel."""
+        if self._has_categories_focus():
+            return
         # Disable Enter shortcut when focusing categories
         self.shortcut_enter.setEnabled(False)
         self.category_panel.focus_first_item()
 
     def _focus_grid(self) -> None:
         """Focus the media grid."""
+        if self._has_grid_focus():
+            return
         # Enable Enter shortcut when focusing grid
         self.shortcut_enter.setEnabled(True)
-        if self.media_grid.all_media_files:
+        if self.media_grid.file_paths:
             # Focus the MediaGrid widget first, then focus first media item
             self.media_grid.setFocus()
             self.media_grid.focus_first()
@@ -280,16 +317,11 @@ class MainWindow(QMainWindow):
         Args:
             file_path: Path to file to open
         """
-        from PySide6.QtGui import QDesktopServices
-        from PySide6.QtCore import QUrl
-
         url = QUrl.fromLocalFile(file_path)
         QDesktopServices.openUrl(url)
 
     def _manage_library(self) -> None:
         """Open library management dialog (reset and rescan)."""
-        from PySide6.QtWidgets import QMessageBox
-
         if not self.controller:
             QMessageBox.warning(
                 self,
@@ -301,9 +333,8 @@ class MainWindow(QMainWindow):
         # Confirm action
         reply = QMessageBox.question(
             self,
-            "Manage Library",
-            "This action will clear the entire current library and rescan the selected folders.\n\n"
-            "Do you want to continue?",
+            _MANAGE_TITLE,
+            _MANAGE_CONFIRM_TEXT,
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
@@ -325,41 +356,29 @@ class MainWindow(QMainWindow):
 
     def _show_shortcuts(self) -> None:
         """Show shortcuts dialog."""
-        from .shortcuts_dialog import ShortcutsDialog
-
         dialog = ShortcutsDialog(self)
         dialog.exec()
 
     def _show_about(self) -> None:
         """Show about dialog."""
-        from PySide6.QtWidgets import QMessageBox, QApplication
-        
-        # Get version from application or version module
-        try:
-            from ..version import get_version
-            version = get_version()
-        except ImportError:
-            version = QApplication.instance().applicationVersion()
-        
-        QMessageBox.about(
-            self,
-            "About Videoteka Media Center",
-            f"Videoteka Media Center v{version}\n\n"
-            "A modern desktop media center application for Linux\n"
-            "with streaming-style interface.\n\n"
-            "Author: Vinícius Gregório\n"
-            "GitHub: https://github.com/vncgregorio/videoteka-media-center\n\n"
-            "Built with PySide6, Pillow, and OpenCV\n\n"
-            "Licensed under GPLv3"
-        )
+        if self._about_text is None:
+            self._about_text = _ABOUT_TEXT.format(version=get_version())
 
-    def set_media_files(self, media_files: list, thumbnail_generator=None) -> None:
+        QMessageBox.about(self, _ABOUT_TITLE, self._about_text)
+
+    def set_media_files(self, media_files: Iterable[dict], thumbnail_generator=None) -> None:
         """Set media files to display.
 
         Args:
-            media_files: List of media file dictionaries
+            media_files: Iterable of media file dictionaries (lists or generators)
             thumbnail_generator: Optional thumbnail generator instance
         """
-        # This will be called by the controller
-        self.media_grid.add_media_files(media_files, thumbnail_generator)
+        # This will be called by the controller.
+        # Suspend repaints while the grid is rebuilt so Qt paints the result once
+        self.media_grid.setUpdatesEnabled(False)
+        try:
+            self.media_grid.add_media_files(media_files, thumbnail_generator)
+        finally:
+            self.media_grid.setUpdatesEnabled(True)
+            self.media_grid.update()
 
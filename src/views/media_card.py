@@ -1,18 +1,24 @@
 """Media card widget for displaying individual media items."""
 
-from pathlib import Path
+import os
 from typing import Optional
 
 from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QPixmap, QFont
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QFont
 from PySide6.QtWidgets import (
     QWidget,
-    QVBoxLayout,
     QLabel,
     QFrame,
 )
 
 
+# Focus reasons that restore focus to the same card rather than moving it
+_REFOCUS_REASONS = (
+    Qt.FocusReason.ActiveWindowFocusReason,
+    Qt.FocusReason.PopupFocusReason,
+)
+
+
 class CardConfig:
     """Configuration constants for media cards."""
     
@@ -20,18 +26,83 @@ class CardConfig:
     THUMBNAIL_WIDTH = 300
     THUMBNAIL_HEIGHT = 200
     
+    # Child placement (fixed geometry, no layout manager)
+    PADDING = 8  # Inset from the card edge, clears the 3px focus border
+    ROW_SPACING = 3
+    NAME_HEIGHT = 34  # Two lines of name text
+    TYPE_HEIGHT = 14
+    
+    # Card size, derived from the child placement above
+    CARD_WIDTH = PADDING + THUMBNAIL_WIDTH + PADDING
+    CARD_HEIGHT = (
+        PADDING + THUMBNAIL_HEIGHT + ROW_SPACING + NAME_HEIGHT + ROW_SPACING + TYPE_HEIGHT + PADDING
+    )
+    
     # Font sizes
     FONT_SIZE_NAME = 12
     FONT_SIZE_TYPE = 10
     FONT_SIZE_PLACEHOLDER = 48
 
 
+# One style sheet for the card and its labels, shared by every card. The
+# thumbnail label carries the placeholder font too, so switching between a
+# thumbnail and the placeholder icon never re-styles the label.
+_CARD_STYLE = f"""
+    MediaCard {{
+        background-color: #1a1a1a;
+        border: 2px solid transparent;
+        border-radius: 8px;
+    }}
+    MediaCard:hover {{
+        border-color: #444444;
+        background-color: #222222;
+    }}
+    MediaCard:focus {{
+        border: 3px solid #0078d4;
+        background-color: #2a2a2a;
+    }}
+    QLabel#thumbnail {{
+        background-color: #2a2a2a;
+        border-radius: 5px;
+        color: #666666;
+        font-size: {CardConfig.FONT_SIZE_PLACEHOLDER}px;
+    }}
+    QLabel#name {{
+        color: #ffffff;
+        font-size: {CardConfig.FONT_SIZE_NAME}px;
+    }}
+    QLabel#type {{
+        color: #888888;
+        font-size: {CardConfig.FONT_SIZE_TYPE}px;
+    }}
+"""
+
+
 class MediaCard(QFrame):
     """Card widget for displaying a media file."""
 
+    # Per-card data lives in slots instead of the instance dict
+    __slots__ = (
+        "file_path",
+        "file_name",
+        "file_type",
+        "thumbnail_path",
+        "thumbnail_label",
+        "name_label",
+        "type_label",
+    )
+
     clicked = Signal(str)  # Emits file_path when clicked
     focused = Signal(str)  # Emits file_path when focused
 
+    # Icon/emoji per media type (shared by all cards)
+    _TYPE_ICONS = {
+        "video": "🎬",
+        "audio": "🎵",
+        "image": "🖼️",
+        "document": "📄",
+    }
+
     def __init__(self, file_path: str, file_name: str, file_type: str, thumbnail_path: Optional[str] = None, parent=None):
         """Initialize media card.
 
@@ -54,53 +125,45 @@ class MediaCard(QFrame):
         self._load_thumbnail()
 
     def _setup_ui(self) -> None:
-        """Setup the card UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
+        """Setup the card UI.
+
+        Cards are laid out in a fixed-size grid cell, so the children get fixed
+        geometry instead of a layout manager that would be re-run per card.
+        """
+        x = CardConfig.PADDING
+        width = CardConfig.THUMBNAIL_WIDTH
+        y = CardConfig.PADDING
 
         # Thumbnail
-        self.thumbnail_label = QLabel()
-        self.thumbnail_label.setFixedSize(CardConfig.THUMBNAIL_WIDTH, CardConfig.THUMBNAIL_HEIGHT)
+        self.thumbnail_label = QLabel(self)
+        self.thumbnail_label.setObjectName("thumbnail")
+        self.thumbnail_label.setGeometry(x, y, width, CardConfig.THUMBNAIL_HEIGHT)
         self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.thumbnail_label.setStyleSheet(
-            "background-color: #2a2a2a; border-radius: 5px;"
-        )
         self.thumbnail_label.setScaledContents(False)
-        layout.addWidget(self.thumbnail_label)
+        y += CardConfig.THUMBNAIL_HEIGHT + CardConfig.ROW_SPACING
 
         # File name
-        self.name_label = QLabel(self.file_name)
+        self.name_label = QLabel(self.file_name, self)
+        self.name_label.setObjectName("name")
+        self.name_label.setGeometry(x, y, width, CardConfig.NAME_HEIGHT)
+        # File names are never markup; skip rich-text detection on every setText
+        self.name_label.setTextFormat(Qt.TextFormat.PlainText)
         self.name_label.setWordWrap(True)
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.name_label.setStyleSheet(f"color: #ffffff; font-size: {CardConfig.FONT_SIZE_NAME}px;")
-        layout.addWidget(self.name_label)
+        y += CardConfig.NAME_HEIGHT + CardConfig.ROW_SPACING
 
         # Type indicator
-        type_icon = self._get_type_icon()
-        if type_icon:
-            type_label = QLabel(type_icon)
-            type_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_label.setStyleSheet(f"color: #888888; font-size: {CardConfig.FONT_SIZE_TYPE}px;")
-            layout.addWidget(type_label)
-
-        self.setStyleSheet(
-            """
-            MediaCard {
-                background-color: #1a1a1a;
-                border: 2px solid transparent;
-                border-radius: 8px;
-            }
-            MediaCard:hover {
-                border-color: #444444;
-                background-color: #222222;
-            }
-            MediaCard:focus {
-                border: 3px solid #0078d4;
-                background-color: #2a2a2a;
-            }
-            """
-        )
+        self.type_label = QLabel(self._get_type_icon(), self)
+        self.type_label.setObjectName("type")
+        self.type_label.setGeometry(x, y, width, CardConfig.TYPE_HEIGHT)
+        self.type_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.type_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.setStyleSheet(_CARD_STYLE)
+
+    def sizeHint(self) -> QSize:
+        """Return the card size implied by CardConfig."""
+        return QSize(CardConfig.CARD_WIDTH, CardConfig.CARD_HEIGHT)
 
     def _get_type_icon(self) -> str:
         """Get icon/emoji for media type.
@@ -108,32 +171,49 @@ class MediaCard(QFrame):
         Returns:
             Icon string
         """
-        icons = {
-            "video": "🎬",
-            "audio": "🎵",
-            "image": "🖼️",
-            "document": "📄",
-        }
-        return icons.get(self.file_type, "📁")
+        return self._TYPE_ICONS.get(self.file_type, "📁")
+
+    def _thumbnail_cache_key(self) -> Optional[str]:
+        """Get the QPixmapCache key for this card's scaled thumbnail.
+
+        The thumbnail file's mtime is part of the key: a thumbnail regenerated
+        in place (same path) gets a new key instead of the old scaled pixmap.
+
+        Returns:
+            Cache key, or None if the thumbnail file is missing
+        """
+        try:
+            mtime_ns = os.stat(self.thumbnail_path).st_mtime_ns
+        except OSError:
+            return None
+        size = self.thumbnail_label.size()
+        return f"{self.thumbnail_path}|{mtime_ns}|{size.width()}x{size.height()}"
 
     def _load_thumbnail(self) -> None:
         """Load thumbnail image."""
-        if self.thumbnail_path and Path(self.thumbnail_path).exists():
-            pixmap = QPixmap(self.thumbnail_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    self.thumbnail_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
+        # A missing thumbnail file has no cache key and gets the placeholder
+        cache_key = self._thumbnail_cache_key() if self.thumbnail_path else None
+        if cache_key:
+            # Scaled thumbnails are shared through QPixmapCache, so cards that are
+            # recreated while scrolling only stat the file instead of decoding it
+            scaled_pixmap = QPixmapCache.find(cache_key)
+            if scaled_pixmap is None:
+                # Through QImage: QPixmap(path) has its own load cache, keyed by
+                # the file's mtime in whole seconds only
+                pixmap = QPixmap.fromImage(QImage(self.thumbnail_path))
+                if not pixmap.isNull():
+                    scaled_pixmap = pixmap.scaled(
+                        self.thumbnail_label.size(),
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+                    QPixmapCache.insert(cache_key, scaled_pixmap)
+            if scaled_pixmap is not None:
                 self.thumbnail_label.setPixmap(scaled_pixmap)
                 return
 
         # Default placeholder
         self.thumbnail_label.setText(self._get_type_icon())
-        self.thumbnail_label.setStyleSheet(
-            f"background-color: #2a2a2a; border-radius: 5px; color: #666666; font-size: {CardConfig.FONT_SIZE_PLACEHOLDER}px;"
-        )
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse press event."""
@@ -143,7 +223,10 @@ class MediaCard(QFrame):
 
     def focusInEvent(self, event) -> None:
         """Handle focus in event."""
-        self.focused.emit(self.file_path)
+        # Window activation and closed popups hand focus back to the card that
+        # already had it; only a real focus move is worth announcing
+        if event.reason() not in _REFOCUS_REASONS:
+            self.focused.emit(self.file_path)
         super().focusInEvent(event)
 
     def set_thumbnail(self, thumbnail_path: str) -> None:
@@ -155,6 +238,41 @@ class MediaCard(QFrame):
         self.thumbnail_path = thumbnail_path
         self._load_thumbnail()
 
+    def set_thumbnail_image(self, thumbnail_path: str, image: QImage) -> None:
+        """Update thumbnail from an image already decoded off the UI thread.
+
+        Args:
+            thumbnail_path: Path to thumbnail image
+            image: Decoded thumbnail, scaled to the thumbnail label size
+        """
+        self.thumbnail_path = thumbnail_path
+        if image.isNull():
+            self._load_thumbnail()
+            return
+        pixmap = QPixmap.fromImage(image)
+        cache_key = self._thumbnail_cache_key()
+        if cache_key:
+            QPixmapCache.insert(cache_key, pixmap)
+        self.thumbnail_label.setPixmap(pixmap)
+
+    def reset(self, file_path: str, file_name: str, file_type: str, thumbnail_path: Optional[str] = None) -> None:
+        """Rebind a pooled card to another media file.
+
+        Args:
+            file_path: Full path to the media file
+            file_name: Name of the file
+            file_type: Type of media ('video', 'audio', 'image', 'document')
+            thumbnail_path: Path to thumbnail image
+        """
+        self.file_path = file_path
+        self.file_name = file_name
+        self.file_type = file_type
+        self.thumbnail_path = thumbnail_path
+        self.name_label.setText(file_name)
+        self.type_label.setText(self._get_type_icon())
+        self.thumbnail_label.clear()
+        self._load_thumbnail()
+
     def clear_thumbnail(self) -> None:
         """Clear thumbnail to free memory."""
         if self.thumbnail_label:
@@ -1,38 +1,59 @@
 """Media grid widget for displaying media files in a grid layout."""
 
-from typing import List, Optional, Dict, Tuple
+import os
+from bisect import bisect_left, insort
+from typing import Iterable, List, Optional, Dict, Tuple
 
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QKeyEvent, QCloseEvent
+from PySide6.QtCore import Qt, Signal, QElapsedTimer, QSize, QThreadPool, QTimer
+from PySide6.QtGui import QKeyEvent, QCloseEvent, QColor, QImage, QPalette
 from PySide6.QtWidgets import (
     QWidget,
-    QGridLayout,
+    QFrame,
     QScrollArea,
     QVBoxLayout,
     QLabel,
 )
 
-from .media_card import MediaCard
-from ..utils.thumbnail_worker import ThumbnailWorker
+from .media_card import CardConfig, MediaCard
+from ..utils.thumbnail_worker import ThumbnailTask
+
+
+# Arrow and page keys are reserved for grid navigation
+_NAV_KEYS = frozenset((
+    Qt.Key.Key_Up,
+    Qt.Key.Key_Down,
+    Qt.Key.Key_Left,
+    Qt.Key.Key_Right,
+    Qt.Key.Key_PageUp,
+    Qt.Key.Key_PageDown,
+))
 
 
 class GridConfig:
     """Configuration constants for the media grid."""
     
     # Grid layout
-    COLUMNS = 4
+    COLUMNS = 4  # Initial column count, recomputed from the viewport width
     
-    # Card dimensions (estimated for lazy loading calculations)
-    CARD_HEIGHT = 250  # Approximate height including thumbnail and margins
-    CARD_THUMBNAIL_WIDTH = 300
-    CARD_THUMBNAIL_HEIGHT = 200
+    # Cell geometry (cards are placed manually on the grid canvas)
+    CARD_WIDTH = CardConfig.CARD_WIDTH  # Cells are exactly one card in size
+    CARD_HEIGHT = CardConfig.CARD_HEIGHT
+    SPACING = 15
+    MARGIN = 20
+    
+    # Colors
+    BACKGROUND_COLOR = "#121212"
     
     # Lazy loading
-    ITEMS_PER_PAGE = 50  # Number of items to render at once
-    LOAD_MORE_THRESHOLD = 20  # Load more when this many items from end
+    PREFETCH_ROWS = 1  # Rows kept alive above and below the viewport
+    PREFETCH_LOOKAHEAD_MS = 250  # Extra rows ahead cover this much scroll motion
     
     # Timing
-    SCROLL_DEBOUNCE_MS = 100  # Debounce time for scroll events
+    SCROLL_THROTTLE_MS = 50  # Minimum interval between card updates while scrolling
+    SCROLL_REST_MS = 150  # Quiet time after which scrolling counts as stopped
+    RESIZE_DEBOUNCE_MS = 50  # Debounce time for column reflow on resize
+    FOCUS_SCROLL_MS = 16  # Focus moves within one frame share a single scroll
+    FOCUS_EMIT_MS = 50  # Quiet time before item_focused reports the focused item
 
 
 class GridScrollArea(QScrollArea):
@@ -54,10 +75,9 @@ class GridScrollArea(QScrollArea):
             self._scroll_callback()
     
     def keyPressEvent(self, event: QKeyEvent) -> None:
-        """Block arrow keys - let parent handle navigation."""
-        key = event.key()
-        # Block arrow keys - don't let scroll area process them
-        if key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right):
+        """Block navigation keys - let parent handle navigation."""
+        # Block arrow and page keys - don't let scroll area process them
+        if event.key() in _NAV_KEYS:
             event.ignore()  # Let parent MediaGrid handle it
             return
         # Allow other keys
@@ -68,7 +88,7 @@ class MediaGrid(QWidget):
     """Grid widget for displaying media cards."""
 
     item_clicked = Signal(str)  # Emits file_path when item is clicked
-    item_focused = Signal(str)  # Emits file_path when item is focused
+    item_focused = Signal(str)  # Emits file_path once focus settles on an item
 
     def __init__(self, parent=None):
         """Initialize media grid.
@@ -77,23 +97,56 @@ class MediaGrid(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.cards: List[MediaCard] = []
-        self.focused_media_index = -1  # Tracks position in all_media_files, not cards
+        self.focused_media_index = -1  # Tracks position in the media list, not cards
         self.grid_columns = GridConfig.COLUMNS
-        self.card_positions: Dict[int, Tuple[int, int]] = {}  # media_index -> (row, col)
+
+        # Cell geometry as plain ints for index <-> pixel arithmetic
+        self._card_w = GridConfig.CARD_WIDTH
+        self._card_h = GridConfig.CARD_HEIGHT
+        self._margin = GridConfig.MARGIN
+        self._step_x = GridConfig.CARD_WIDTH + GridConfig.SPACING
+        self._step_y = GridConfig.CARD_HEIGHT + GridConfig.SPACING
         
         # Lazy loading support
-        self.all_media_files: List[dict] = []  # All media file data
+        # All media file data, one parallel list per field
+        self.file_paths: List[str] = []
+        self._file_names: List[str] = []
+        self._file_types: List[str] = []
+        self._thumbnail_paths: List[Optional[str]] = []
+        self._count = 0  # Number of media files, read on every navigation step
         self.thumbnail_generator = None
-        self.thumbnail_workers: Dict[str, ThumbnailWorker] = {}  # file_path -> worker
+        self.thumbnail_tasks: Dict[str, ThumbnailTask] = {}  # file_path -> queued/running task
+        # Own pool so thumbnail decoding can't take every core (or the global pool)
+        self.thumbnail_pool = QThreadPool(self)
+        self.thumbnail_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
         self.visible_range: Tuple[int, int] = (0, 0)  # (start_index, end_index)
-        self.items_per_page = GridConfig.ITEMS_PER_PAGE
-        self.load_more_threshold = GridConfig.LOAD_MORE_THRESHOLD
         self.card_to_index: Dict[MediaCard, int] = {}  # card -> media_index
+        self.index_to_card: Dict[int, MediaCard] = {}  # media_index -> card
+        self._live_indices: List[int] = []  # Keys of index_to_card, kept sorted
+        self.path_to_card: Dict[str, MediaCard] = {}  # file_path -> card
+        self._prev_focused_card: Optional[MediaCard] = None  # Last card given focus
+        self._pending_focus_path: Optional[str] = None  # Card focused since the last emit
+        self._last_focus_path: Optional[str] = None  # Path item_focused last reported
+        self._pool: List[MediaCard] = []  # Hidden cards waiting to be reused
+
+        # Navigation key -> navigation method
+        self._nav = {
+            Qt.Key.Key_Right: self.focus_right,
+            Qt.Key.Key_Left: self.focus_left,
+            Qt.Key.Key_Down: self.focus_down,
+            Qt.Key.Key_Up: self.focus_up,
+            Qt.Key.Key_PageDown: self.focus_page_down,
+            Qt.Key.Key_PageUp: self.focus_page_up,
+        }
         
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self._setup_ui()
 
+    @property
+    def cards(self):
+        """Live media cards (a view over the cards currently on the canvas)."""
+        return self.index_to_card.values()
+
     def _setup_ui(self) -> None:
         """Setup the grid UI."""
         layout = QVBoxLayout(self)
@@ -104,17 +157,18 @@ class MediaGrid(QWidget):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("background-color: #121212; border: none;")
+        # Static colors go through the palette; a style sheet here would be
+        # re-resolved for every card created inside the scroll area
+        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
         self.scroll_area.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Grid container
-        self.grid_widget = QWidget()
-        self.grid_widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.grid_layout = QGridLayout(self.grid_widget)
-        self.grid_layout.setSpacing(15)
-        self.grid_layout.setContentsMargins(20, 20, 20, 20)
-
-        self.scroll_area.setWidget(self.grid_widget)
+        # The grid canvas always covers the viewport, so the viewport itself
+        # never needs its background erased
+        viewport = self.scroll_area.viewport()
+        viewport.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        viewport.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+
+        # Grid canvas - cards are positioned manually, only around the viewport
+        self.grid_widget = self._create_canvas()
         layout.addWidget(self.scroll_area)
         
         # Connect scroll callback for lazy loading
@@ -127,46 +181,111 @@ class MediaGrid(QWidget):
         self.empty_label.setVisible(False)
         layout.addWidget(self.empty_label)
         
-        # Timer for debouncing scroll events
+        # Trailing-edge timer for throttled scroll updates
         self.scroll_timer = QTimer(self)
         self.scroll_timer.setSingleShot(True)
-        self.scroll_timer.timeout.connect(self._update_visible_items)
+        self.scroll_timer.timeout.connect(self._on_scroll)
+        self._scroll_clock = QElapsedTimer()  # Time since the last scroll-driven update
+        self._scroll_clock.start()
+        self._last_scroll_value = 0  # Scroll position at the last scroll-driven update
+        self._prefetch_ahead = 0  # Extra rows in the scroll direction (negative: up)
+
+        # Timer that drops the extra prefetch rows once scrolling stops
+        self._scroll_rest_timer = QTimer(self)
+        self._scroll_rest_timer.setSingleShot(True)
+        self._scroll_rest_timer.setInterval(GridConfig.SCROLL_REST_MS)
+        self._scroll_rest_timer.timeout.connect(self._on_scroll_rest)
+
+        # Timer that scrolls the focused card into view once per frame
+        self._focus_scroll_timer = QTimer(self)
+        self._focus_scroll_timer.setSingleShot(True)
+        self._focus_scroll_timer.timeout.connect(self._scroll_focused_into_view)
+
+        # Timer that reports card focus once rapid navigation settles
+        self._focus_emit_timer = QTimer(self)
+        self._focus_emit_timer.setSingleShot(True)
+        self._focus_emit_timer.setInterval(GridConfig.FOCUS_EMIT_MS)
+        self._focus_emit_timer.timeout.connect(self._emit_focused)
+
+        # Timer for debouncing column reflow while the window is resized
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self._reflow)
+
+    def _create_canvas(self) -> QWidget:
+        """Create an empty grid canvas and install it in the scroll area.
+
+        Returns:
+            The new canvas widget
+        """
+        canvas = QWidget()
+        canvas.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        canvas.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        palette = canvas.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(GridConfig.BACKGROUND_COLOR))
+        canvas.setPalette(palette)
+        canvas.setAutoFillBackground(True)
+        self.scroll_area.setWidget(canvas)
+        return canvas
 
     def clear(self) -> None:
         """Clear all cards from the grid."""
-        # Cancel and cleanup all thumbnail workers
-        for worker in list(self.thumbnail_workers.values()):
-            worker.cleanup()  # Use cleanup method which properly terminates thread
-            # Note: PySide6 automatically cleans up signals when objects are deleted
-            worker.deleteLater()
-        self.thumbnail_workers.clear()
-        
-        # Remove all cards
-        for card in self.cards:
-            # Clear thumbnails to free memory
-            card.clear_thumbnail()
-            card.deleteLater()
-        self.cards.clear()
-        self.card_positions.clear()
-        self.card_to_index.clear()
+        # Cancel all pending thumbnail tasks
+        self._cancel_all_thumbnails()
+        
+        # Swap in a fresh canvas; the old one is destroyed together with all of
+        # its cards from the event loop instead of card by card here
+        old_canvas = self.scroll_area.takeWidget()
+        old_canvas.hide()
+        QTimer.singleShot(0, old_canvas.deleteLater)
+        self.grid_widget = self._create_canvas()
+
+        self.card_to_index = {}
+        self.index_to_card = {}
+        self._live_indices = []
+        self.path_to_card = {}
+        self._pool = []  # Pooled cards belonged to the old canvas
+        self._prev_focused_card = None
+        self._focus_emit_timer.stop()
+        self._pending_focus_path = None
+        self._last_focus_path = None
         self.focused_media_index = -1
-        self.all_media_files.clear()
+        self.file_paths = []
+        self._file_names = []
+        self._file_types = []
+        self._thumbnail_paths = []
+        self._count = 0
         self.visible_range = (0, 0)
+        self._scroll_rest_timer.stop()
+        self._last_scroll_value = 0
+        self._prefetch_ahead = 0
 
     def add_media_files(
         self,
-        media_files: List[dict],
+        media_files: Iterable[dict],
         thumbnail_generator=None,
     ) -> None:
         """Add media files to the grid with lazy loading.
 
         Args:
-            media_files: List of dictionaries with media file data
+            media_files: Iterable of dictionaries with media file data
             thumbnail_generator: Optional thumbnail generator instance
         """
         self.clear()
 
-        if not media_files:
+        # Lazy loading needs random access, so the input is materialized once,
+        # pulling the fields out of each dict here instead of per card build
+        file_paths = []
+        file_names = []
+        file_types = []
+        thumbnail_paths = []
+        for data in media_files:
+            file_paths.append(data.get("file_path", ""))
+            file_names.append(data.get("file_name", ""))
+            file_types.append(data.get("file_type", "video"))
+            thumbnail_paths.append(data.get("thumbnail_path"))
+
+        if not file_paths:
             self.empty_label.setVisible(True)
             return
 
@@ -174,214 +293,346 @@ class MediaGrid(QWidget):
         self.thumbnail_generator = thumbnail_generator
         
         # Store all media files data
-        self.all_media_files = media_files
-        
-        # Initially load first page of items
-        initial_end = min(len(media_files), self.items_per_page)
-        self.visible_range = (0, initial_end)
-        self._create_cards_for_range(0, initial_end)
-        
-        # Initialize focused_media_index but don't move focus
-        # Focus will be set only when user explicitly navigates to grid (via G key)
-        if self.all_media_files:
-            self.focused_media_index = 0
-            # Don't set focus automatically - preserve current focus (e.g., categories)
+        self.file_paths = file_paths
+        self._file_names = file_names
+        self._file_types = file_types
+        self._thumbnail_paths = thumbnail_paths
+        self._count = len(file_paths)
+        
+        # Size the canvas for the whole virtual grid, then create cards for
+        # the rows around the viewport only
+        if self.scroll_area.isVisible():
+            self.grid_columns = self._columns_for_width(self.scroll_area.viewport().width())
+        self._update_canvas_size()
+        self.scroll_area.verticalScrollBar().setValue(0)
+
+        self._update_visible_items()
+        
+        # focused_media_index stays -1 (from clear()) until an item is focused:
+        # focus is set only when the user explicitly navigates to the grid (via
+        # G key), so the current focus (e.g., categories) is preserved, and no
+        # card is kept alive as "focused" while scrolling
     
+    def _update_canvas_size(self) -> None:
+        """Size the canvas for the whole virtual grid so the scrollbar is correct."""
+        cols = self.grid_columns
+        rows = (self._count + cols - 1) // cols
+        spacing = GridConfig.SPACING
+        self.grid_widget.setMinimumSize(
+            cols * self._step_x - spacing + 2 * self._margin,
+            rows * self._step_y - spacing + 2 * self._margin,
+        )
+
     def _update_visible_items(self) -> None:
         """Update which items are visible and create/remove cards accordingly."""
-        if not self.all_media_files:
+        if not self._count:
             return
         
-        # Calculate visible range based on scroll position
-        scrollbar = self.scroll_area.verticalScrollBar()
+        # Rows intersecting the viewport, plus a prefetch margin on each side
+        scroll_value = self.scroll_area.verticalScrollBar().value()
         viewport_height = self.scroll_area.viewport().height()
-        scroll_value = scrollbar.value()
-        
-        # Estimate which items should be visible
-        card_height = GridConfig.CARD_HEIGHT
-        cards_per_row = self.grid_columns
-        rows_visible = max(3, (viewport_height // card_height) + 2)  # Show a bit extra
-        items_visible = rows_visible * cards_per_row
-        
-        # Calculate start index (rough estimate)
-        start_row = max(0, scroll_value // card_height - 1)
-        start_index = max(0, start_row * cards_per_row)
-        end_index = min(len(self.all_media_files), start_index + items_visible + self.load_more_threshold)
-        
-        # Expand range to include buffer
-        start_index = max(0, start_index - self.load_more_threshold)
-        
-        # Update visible range
-        old_start, old_end = self.visible_range
+        step_y = self._step_y
+        margin = self._margin
+        cols = self.grid_columns
+        ahead = self._prefetch_ahead
+        rows_above = GridConfig.PREFETCH_ROWS + max(0, -ahead)
+        rows_below = GridConfig.PREFETCH_ROWS + max(0, ahead)
+        first_row = max(0, (scroll_value - margin) // step_y - rows_above)
+        last_row = (scroll_value + viewport_height - margin) // step_y + rows_below
+        start_index = first_row * cols
+        end_index = min(self._count, (last_row + 1) * cols)
+        if (start_index, end_index) == self.visible_range:
+            return  # Moved less than a row: the live cards already cover it
         self.visible_range = (start_index, end_index)
-        
-        # Remove cards that are no longer visible
-        cards_to_remove = []
-        for card in self.cards:
-            # Get media index for this card
-            media_index = self.card_to_index.get(card)
+
+        # Swap cards in one batch so the canvas repaints once, not per card
+        batch = self.grid_widget.updatesEnabled()
+        if batch:
+            self.grid_widget.setUpdatesEnabled(False)
+        try:
+            self._remove_cards_outside(start_index, end_index)
+            self._create_cards_for_range(start_index, end_index)
+        finally:
+            if batch:
+                self.grid_widget.setUpdatesEnabled(True)  # Also schedules the repaint
+
+    def _remove_cards_outside(self, start_index: int, end_index: int) -> None:
+        """Remove cards outside the given range, keeping the focused card.
+
+        Args:
+            start_index: First media index to keep
+            end_index: Media index past the last one to keep
+        """
+        # Live indices are sorted, so the ones outside the range are the two
+        # ends of the list; the focused card stays so focus isn't lost while scrolling
+        live = self._live_indices
+        low = bisect_left(live, start_index)
+        high = bisect_left(live, end_index, low)
+        indices_to_remove = live[:low] + live[high:]
+        kept = live[low:high]
+        focused_index = self.focused_media_index
+        if focused_index in self.index_to_card and not start_index <= focused_index < end_index:
+            indices_to_remove.remove(focused_index)
+            insort(kept, focused_index)
+        self._live_indices = kept
+        
+        # Remove cards; up to a full window of them is pooled, so even a jump
+        # to a distant page (End, Page Down) rebinds cards instead of creating them
+        pool_limit = end_index - start_index
+        for index in indices_to_remove:
+            card = self.index_to_card.pop(index)
             
-            if media_index is None or media_index < start_index or media_index >= end_index:
-                cards_to_remove.append(card)
-        
-        # Remove cards
-        for card in cards_to_remove:
-            # Cancel thumbnail worker if exists
-            card_file_path = card.file_path
-            if card_file_path in self.thumbnail_workers:
-                worker = self.thumbnail_workers.pop(card_file_path)
-                worker.cleanup()  # Use cleanup method which properly terminates thread
-                # Note: PySide6 automatically cleans up signals when objects are deleted
-                worker.deleteLater()
+            # Skip the thumbnail task if it hasn't produced a result yet
+            self._cancel_thumbnail(card.file_path)
             
             # Clear thumbnail to free memory
             card.clear_thumbnail()
             
-            # Get media index before removing
-            media_index = self.card_to_index.pop(card, None)
-            
-            # Remove from layout and list
-            self.grid_layout.removeWidget(card)
-            card.deleteLater()
-            if card in self.cards:
-                self.cards.remove(card)
+            # Forget which media index this card represented
+            del self.card_to_index[card]
+            if self.path_to_card.get(card.file_path) is card:
+                del self.path_to_card[card.file_path]
+            if card is self._prev_focused_card:
+                self._prev_focused_card = None
             
-            # Update card_positions
-            if media_index is not None and media_index in self.card_positions:
-                del self.card_positions[media_index]
-        
-        # Create cards for newly visible items
-        self._create_cards_for_range(start_index, end_index)
+            if len(self._pool) < pool_limit:
+                card.hide()
+                self._pool.append(card)
+            else:
+                card.deleteLater()
     
     def _create_cards_for_range(self, start_index: int, end_index: int) -> None:
         """Create cards for items in the given range."""
-        for index in range(start_index, min(end_index, len(self.all_media_files))):
+        viewport_center = (
+            self.scroll_area.verticalScrollBar().value()
+            + self.scroll_area.viewport().height() // 2
+        )
+        center_row = (viewport_center - self._margin) // self._step_y
+        for index in range(start_index, min(end_index, self._count)):
             # Check if card already exists
-            if any(card.file_path == self.all_media_files[index].get("file_path") for card in self.cards):
+            if index in self.index_to_card:
                 continue
-            
-            media_data = self.all_media_files[index]
-            file_path = media_data.get("file_path", "")
-            file_name = media_data.get("file_name", "")
-            file_type = media_data.get("file_type", "video")
-            thumbnail_path = media_data.get("thumbnail_path")
+            file_path = self.file_paths[index]
+            file_name = self._file_names[index]
+            file_type = self._file_types[index]
+            thumbnail_path = self._thumbnail_paths[index]
 
             # Calculate grid position
-            row = index // self.grid_columns
-            col = index % self.grid_columns
+            row, col = divmod(index, self.grid_columns)
             
-            # Create card (thumbnail will be loaded asynchronously)
-            card = MediaCard(file_path, file_name, file_type, thumbnail_path)
-            card.clicked.connect(self.item_clicked.emit)
-            card.focused.connect(self.item_focused.emit)
-
-            self.grid_layout.addWidget(card, row, col)
-            self.cards.append(card)
-            self.card_positions[index] = (row, col)
+            # Reuse a pooled card or create one (thumbnail will be loaded asynchronously)
+            if self._pool:
+                card = self._pool.pop()
+                card.reset(file_path, file_name, file_type, thumbnail_path)
+            else:
+                card = MediaCard(file_path, file_name, file_type, thumbnail_path, self.grid_widget)
+                card.setFixedSize(self._card_w, self._card_h)
+                card.clicked.connect(self.item_clicked.emit)
+                card.focused.connect(self._on_card_focused)
+
+            # Every cell has the card's size, so placing a card is just a move
+            card.move(self._margin + col * self._step_x, self._margin + row * self._step_y)
+            card.show()
+            self.index_to_card[index] = card
+            insort(self._live_indices, index)
+            self.path_to_card[file_path] = card
             self.card_to_index[card] = index  # Track which media index this card represents
             
             # Start async thumbnail generation if needed
             if not thumbnail_path and self.thumbnail_generator:
-                self._load_thumbnail_async(file_path, file_type, card)
+                # Rows nearest the middle of the viewport are generated first;
+                # prefetch rows wait behind what is actually on screen
+                priority = -abs(row - center_row)
+                self._load_thumbnail_async(file_path, file_type, priority)
     
-    def _load_thumbnail_async(self, file_path: str, file_type: str, card: MediaCard) -> None:
-        """Load thumbnail asynchronously for a card."""
-        # Don't start duplicate workers
-        if file_path in self.thumbnail_workers:
+    def _load_thumbnail_async(
+        self,
+        file_path: str,
+        file_type: str,
+        priority: int = 0,
+    ) -> None:
+        """Load thumbnail asynchronously for a media file's card.
+
+        Args:
+            file_path: Path of the media file
+            file_type: Type of media
+            priority: Thread pool priority (higher runs first)
+        """
+        # Don't start duplicate tasks. A cancelled task still tracked here may
+        # already be running past its last check, so it can't be revived; a
+        # fresh task replaces it and the old one is forgotten when it finishes
+        task = self.thumbnail_tasks.get(file_path)
+        if task is not None and not task.cancelled:
             return
-        
-        # Check cache first
-        if self.thumbnail_generator:
-            cache_path = self.thumbnail_generator.get_thumbnail_path(file_path)
-            if cache_path:
-                card.set_thumbnail(cache_path)
-                return
-        
-        # Create worker thread
-        worker = ThumbnailWorker(file_path, file_type, self.thumbnail_generator, self)
-        worker.thumbnail_ready.connect(lambda fp, tp: self._on_thumbnail_ready(fp, tp, card))
-        worker.thumbnail_failed.connect(lambda fp: self._on_thumbnail_failed(fp))
-        self.thumbnail_workers[file_path] = worker
-        worker.start()
-    
-    def _on_thumbnail_ready(self, file_path: str, thumbnail_path: str, card: MediaCard) -> None:
+
+        # Look up, generate and decode on the thumbnail pool (the cache lookup
+        # stats the disk too); the card keeps its placeholder meanwhile
+        task = ThumbnailTask(
+            file_path,
+            file_type,
+            self.thumbnail_generator,
+            QSize(CardConfig.THUMBNAIL_WIDTH, CardConfig.THUMBNAIL_HEIGHT),
+        )
+        task.signals.thumbnail_ready.connect(self._on_thumbnail_ready)
+        task.signals.finished.connect(self._on_thumbnail_task_finished)
+        self.thumbnail_tasks[file_path] = task
+        self.thumbnail_pool.start(task.run, priority)
+
+    def _cancel_thumbnail(self, file_path: str) -> None:
+        """Cancel the thumbnail task for a file, if any.
+
+        Args:
+            file_path: Path of the media file
+        """
+        # Started tasks are plain callables and can't be taken back from the
+        # pool; a cancelled task returns as soon as it runs and reports
+        # `finished`, which is when it's forgotten
+        task = self.thumbnail_tasks.get(file_path)
+        if task is not None:
+            task.cancel()
+
+    def _cancel_all_thumbnails(self) -> None:
+        """Cancel every pending thumbnail task."""
+        for file_path in list(self.thumbnail_tasks):
+            self._cancel_thumbnail(file_path)
+
+    def _on_thumbnail_ready(self, file_path: str, thumbnail_path: str, image: QImage) -> None:
         """Handle thumbnail ready signal."""
-        if file_path in self.thumbnail_workers:
-            worker = self.thumbnail_workers.pop(file_path)
-            # Thread should already be finished, but ensure cleanup
-            if worker.isRunning():
-                worker.wait(100)
-            # Note: PySide6 automatically cleans up signals when objects are deleted
-            worker.deleteLater()
-        
-        # Update card thumbnail
-        if card and card.file_path == file_path:
-            card.set_thumbnail(thumbnail_path)
-    
-    def _on_thumbnail_failed(self, file_path: str) -> None:
-        """Handle thumbnail generation failure."""
-        if file_path in self.thumbnail_workers:
-            worker = self.thumbnail_workers.pop(file_path)
-            # Thread should already be finished, but ensure cleanup
-            if worker.isRunning():
-                worker.wait(100)
-            # Note: PySide6 automatically cleans up signals when objects are deleted
-            worker.deleteLater()
+        card = self.path_to_card.get(file_path)
+        # A pooled card may have been rebound to another file since
+        if card is not None and card.file_path == file_path:
+            # Remember the thumbnail so the card is built with it next time
+            self._thumbnail_paths[self.card_to_index[card]] = thumbnail_path
+            card.set_thumbnail_image(thumbnail_path, image)
+
+    def _on_card_focused(self, file_path: str) -> None:
+        """Record the focused card and restart the focus emit timer.
+
+        Cards take focus immediately; only the outward item_focused signal
+        waits, so holding an arrow key reports the card it stops on.
+
+        Args:
+            file_path: Path of the focused media file
+        """
+        self._pending_focus_path = file_path
+        self._focus_emit_timer.start()
+
+    def _emit_focused(self) -> None:
+        """Emit item_focused for the card focus settled on."""
+        file_path = self._pending_focus_path
+        if file_path and file_path != self._last_focus_path:
+            self._last_focus_path = file_path
+            self.item_focused.emit(file_path)
+
+    def _on_thumbnail_task_finished(self, file_path: str) -> None:
+        """Forget a thumbnail task once it has run.
+
+        Args:
+            file_path: Path of the media file
+        """
+        # A cancelled task may finish after a replacement was queued for the path
+        task = self.thumbnail_tasks.get(file_path)
+        if task is not None and task.signals is self.sender():
+            del self.thumbnail_tasks[file_path]
     
     def _on_scroll(self) -> None:
-        """Handle scroll event (debounced)."""
-        self.scroll_timer.start(GridConfig.SCROLL_DEBOUNCE_MS)
+        """Handle scroll event (throttled).
 
-    def _get_card_position(self, media_index: int) -> Optional[Tuple[int, int]]:
-        """Get grid position (row, col) of media item at index.
+        Cards are updated at most every SCROLL_THROTTLE_MS while scrolling
+        continues, so rows fill in during a long drag instead of only after it
+        stops; a trailing update covers the final position.
+        """
+        elapsed = self._scroll_clock.elapsed()
+        if elapsed >= GridConfig.SCROLL_THROTTLE_MS:
+            self.scroll_timer.stop()
+            self._scroll_clock.restart()
+
+            # Prefetch further ahead the faster the view is moving, enough rows
+            # to cover PREFETCH_LOOKAHEAD_MS of motion, capped at one page
+            value = self.scroll_area.verticalScrollBar().value()
+            delta = value - self._last_scroll_value
+            self._last_scroll_value = value
+            rows = abs(delta) * GridConfig.PREFETCH_LOOKAHEAD_MS // (elapsed * self._step_y)
+            rows = min(rows, self._rows_per_page())
+            self._prefetch_ahead = rows if delta > 0 else -rows
+
+            self._update_visible_items()
+        elif not self.scroll_timer.isActive():
+            self.scroll_timer.start(GridConfig.SCROLL_THROTTLE_MS - elapsed)
+
+        # Every scroll event postpones shrinking back to PREFETCH_ROWS
+        if self._prefetch_ahead:
+            self._scroll_rest_timer.start()
+
+    def _on_scroll_rest(self) -> None:
+        """Drop the velocity-based prefetch rows once the view is at rest."""
+        if self._prefetch_ahead:
+            self._prefetch_ahead = 0
+            self._update_visible_items()
+
+    def resizeEvent(self, event) -> None:
+        """Refresh visible cards and schedule a column reflow on resize."""
+        super().resizeEvent(event)
+        self.resize_timer.start(GridConfig.RESIZE_DEBOUNCE_MS)
+        self._on_scroll()
+
+    def _columns_for_width(self, width: int) -> int:
+        """Calculate how many card columns fit in the given width.
 
         Args:
-            media_index: Media file index in all_media_files
+            width: Available width in pixels
 
         Returns:
-            Tuple of (row, col) or None
+            Number of columns (at least 1)
         """
-        return self.card_positions.get(media_index)
+        return max(1, (width - 2 * self._margin + GridConfig.SPACING) // self._step_x)
+
+    def _reflow(self) -> None:
+        """Re-position existing cards if the viewport now fits a different column count."""
+        cols = self._columns_for_width(self.scroll_area.viewport().width())
+        if cols == self.grid_columns:
+            return
+
+        self.grid_columns = cols
+        self._update_canvas_size()
+
+        # Move the live cards to their new cells instead of recreating them
+        margin = self._margin
+        step_x = self._step_x
+        step_y = self._step_y
+        for index, card in self.index_to_card.items():
+            row, col = divmod(index, cols)
+            card.move(margin + col * step_x, margin + row * step_y)
+
+        self._update_visible_items()
+        if self.focused_media_index >= 0:
+            self._ensure_card_visible_for_media_index(self.focused_media_index)
 
     def _get_card_for_media_index(self, media_index: int) -> Optional[MediaCard]:
         """Get card for media index, ensuring it exists.
 
         Args:
-            media_index: Media file index in all_media_files
+            media_index: Index in the grid's media list
 
         Returns:
             MediaCard instance or None if media_index is invalid
         """
-        if media_index < 0 or media_index >= len(self.all_media_files):
+        if media_index < 0 or media_index >= self._count:
             return None
         
-        # Find existing card
-        for card, idx in self.card_to_index.items():
-            if idx == media_index:
-                return card
-        
-        # Card doesn't exist - ensure it's in visible range and create it
-        start, end = self.visible_range
-        if media_index < start or media_index >= end:
-            # Expand visible range to include this index
-            buffer = self.load_more_threshold
-            new_start = max(0, media_index - buffer)
-            new_end = min(len(self.all_media_files), media_index + buffer + 1)
-            self._create_cards_for_range(new_start, new_end)
-            self.visible_range = (new_start, new_end)
-        
-        # Card should now exist
-        for card, idx in self.card_to_index.items():
-            if idx == media_index:
-                return card
-        
-        return None
+        card = self.index_to_card.get(media_index)
+        if card is None:
+            # Card doesn't exist yet (outside the viewport) - create it on its own;
+            # the cards around it follow once the scroll area reaches it
+            self._create_cards_for_range(media_index, media_index + 1)
+            card = self.index_to_card.get(media_index)
+        return card
 
     def _focus_media_index(self, media_index: int) -> bool:
         """Focus media item at given index.
 
         Args:
-            media_index: Media file index in all_media_files
+            media_index: Index in the grid's media list
 
         Returns:
             True if focus was set, False otherwise
@@ -390,7 +641,12 @@ class MediaGrid(QWidget):
         if card:
             self.focused_media_index = media_index
             card.setFocus()
-            card.update()
+            # Repaint only the two cards whose focus state changed
+            prev = self._prev_focused_card
+            if prev is not None and prev is not card:
+                prev.update(prev.rect())
+            card.update(card.rect())
+            self._prev_focused_card = card
             self._ensure_card_visible_for_media_index(media_index)
             return True
         return False
@@ -398,105 +654,112 @@ class MediaGrid(QWidget):
     def _ensure_card_visible_for_media_index(self, media_index: int) -> None:
         """Ensure card for media index is visible in scroll area.
 
-        Args:
-            media_index: Media file index in all_media_files
-        """
-        card = self._get_card_for_media_index(media_index)
-        if card:
-            self.scroll_area.ensureWidgetVisible(card)
-
-    def _calculate_media_index(self, row: int, col: int) -> Optional[int]:
-        """Calculate media index from grid position.
+        The scroll is deferred by up to a frame, so a burst of focus moves (a
+        held arrow key) scrolls once, to the item focused last. Only the
+        focused item is ever scrolled to, so the index is read back from
+        focused_media_index when the timer fires.
 
         Args:
-            row: Row number (0-based)
-            col: Column number (0-based)
-
-        Returns:
-            Media index or None if position is invalid
+            media_index: Index in the grid's media list
         """
-        if row < 0 or col < 0 or col >= self.grid_columns:
-            return None
-        index = row * self.grid_columns + col
-        return index if 0 <= index < len(self.all_media_files) else None
+        if not self._focus_scroll_timer.isActive():
+            self._focus_scroll_timer.start(GridConfig.FOCUS_SCROLL_MS)
 
-    def _get_current_position(self) -> Optional[Tuple[int, int]]:
-        """Get current (row, col) position from focused_media_index.
+    def _scroll_focused_into_view(self) -> None:
+        """Scroll the focused card into view."""
+        media_index = self.focused_media_index
+        if media_index < 0 or media_index >= self._count:
+            return
 
-        Returns:
-            Tuple of (row, col) or None if no focus
-        """
-        if self.focused_media_index < 0 or not self.all_media_files:
-            return None
-        row = self.focused_media_index // self.grid_columns
-        col = self.focused_media_index % self.grid_columns
-        return (row, col)
+        # The card's row position is known from the index, so scroll by
+        # pixel offset instead of asking the scroll area to walk widget geometry
+        margin = self._margin
+        top = (media_index // self.grid_columns) * self._step_y + margin
+        bottom = top + self._card_h
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        viewport_height = self.scroll_area.viewport().height()
+        value = scroll_bar.value()
+        if top - margin < value:
+            scroll_bar.setValue(top - margin)
+        elif bottom + margin > value + viewport_height:
+            scroll_bar.setValue(bottom + margin - viewport_height)
 
-    def _navigate_to_position(self, delta_row: int, delta_col: int) -> bool:
-        """Navigate to position relative to current, handling bounds.
+    def _move(self, delta: int) -> bool:
+        """Move focus by an index offset, clamped to the media list.
+
+        Moving past the end of a row wraps to the next row (and back),
+        moving past the first or last row stops at the first or last item.
 
         Args:
-            delta_row: Change in row (positive = down, negative = up)
-            delta_col: Change in column (positive = right, negative = left)
+            delta: Index offset (+/-1 for columns, +/-grid_columns for rows)
 
         Returns:
-            True if navigation succeeded, False otherwise
+            True if focus moved, False if already at the edge
         """
-        if not self.all_media_files:
-            return False
-        
-        # If no item has focus, start from first
-        if self.focused_media_index < 0:
-            return self._focus_media_index(0)
-        
-        pos = self._get_current_position()
-        if not pos:
-            return False
-        
-        new_row = pos[0] + delta_row
-        new_col = pos[1] + delta_col
-        
-        # Check bounds
-        if new_row < 0 or new_col < 0 or new_col >= self.grid_columns:
+        index = self.focused_media_index
+        if index < 0:
+            return self.focus_first()
+
+        target = min(max(index + delta, 0), self._count - 1)
+        if target == index:
             return False
-        
-        new_index = self._calculate_media_index(new_row, new_col)
-        if new_index is not None:
-            return self._focus_media_index(new_index)
-        
-        return False
+        return self._focus_media_index(target)
 
     def focus_right(self) -> bool:
-        """Focus the next media item in the same row (next column).
+        """Focus the next media item, wrapping to the next row.
 
         Returns:
-            True if focus moved, False if already at end of row
+            True if focus moved, False if already at the last item
         """
-        return self._navigate_to_position(0, 1)
+        return self._move(1)
 
     def focus_left(self) -> bool:
-        """Focus the previous media item in the same row (previous column).
+        """Focus the previous media item, wrapping to the previous row.
 
         Returns:
-            True if focus moved, False if already at start of row
+            True if focus moved, False if already at the first item
         """
-        return self._navigate_to_position(0, -1)
+        return self._move(-1)
 
     def focus_down(self) -> bool:
         """Focus the media item in the same column, next row.
 
+        On the last row focus moves to the last item instead.
+
         Returns:
-            True if focus moved, False if already at last row
+            True if focus moved, False if already at the last item
         """
-        return self._navigate_to_position(1, 0)
+        return self._move(self.grid_columns)
 
     def focus_up(self) -> bool:
         """Focus the media item in the same column, previous row.
 
+        On the first row focus moves to the first item instead.
+
         Returns:
-            True if focus moved, False if already at first row
+            True if focus moved, False if already at the first item
         """
-        return self._navigate_to_position(-1, 0)
+        return self._move(-self.grid_columns)
+
+    def _rows_per_page(self) -> int:
+        """Number of full card rows that fit in the viewport (at least 1)."""
+        return max(1, self.scroll_area.viewport().height() // self._step_y)
+
+    def focus_page_down(self) -> bool:
+        """Focus the media item in the same column one page of rows down.
+
+        Returns:
+            True if focus moved, False if already at the last item
+        """
+        return self._move(self._rows_per_page() * self.grid_columns)
+
+    def focus_page_up(self) -> bool:
+        """Focus the media item in the same column one page of rows up.
+
+        Returns:
+            True if focus moved, False if already at the first item
+        """
+        return self._move(-self._rows_per_page() * self.grid_columns)
 
     def focus_next(self) -> bool:
         """Focus the next media item (linear navigation).
@@ -504,13 +767,9 @@ class MediaGrid(QWidget):
         Returns:
             True if focus moved, False if already at end
         """
-        if not self.all_media_files or self.focused_media_index < 0:
+        if self.focused_media_index < 0:
             return False
-
-        if self.focused_media_index < len(self.all_media_files) - 1:
-            return self._focus_media_index(self.focused_media_index + 1)
-        
-        return False
+        return self._move(1)
 
     def focus_previous(self) -> bool:
         """Focus the previous media item (linear navigation).
@@ -518,13 +777,9 @@ class MediaGrid(QWidget):
         Returns:
             True if focus moved, False if already at start
         """
-        if not self.all_media_files or self.focused_media_index < 0:
+        if self.focused_media_index < 0:
             return False
-
-        if self.focused_media_index > 0:
-            return self._focus_media_index(self.focused_media_index - 1)
-        
-        return False
+        return self._move(-1)
 
     def focus_first(self) -> bool:
         """Focus the first media item.
@@ -532,7 +787,7 @@ class MediaGrid(QWidget):
         Returns:
             True if focus moved
         """
-        if not self.all_media_files:
+        if not self._count:
             return False
 
         return self._focus_media_index(0)
@@ -543,10 +798,10 @@ class MediaGrid(QWidget):
         Returns:
             True if focus moved
         """
-        if not self.all_media_files:
+        if not self._count:
             return False
 
-        return self._focus_media_index(len(self.all_media_files) - 1)
+        return self._focus_media_index(self._count - 1)
 
     def get_focused_file_path(self) -> Optional[str]:
         """Get file path of currently focused media item.
@@ -554,29 +809,17 @@ class MediaGrid(QWidget):
         Returns:
             File path or None
         """
-        if 0 <= self.focused_media_index < len(self.all_media_files):
-            return self.all_media_files[self.focused_media_index].get("file_path")
+        if 0 <= self.focused_media_index < self._count:
+            return self.file_paths[self.focused_media_index]
         return None
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Handle key press events for grid navigation."""
-        key = event.key()
-        
         # Handle arrow keys - process them here to prevent scroll area from handling
-        if key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right):
-            handled = False
-            if key == Qt.Key.Key_Right:
-                handled = self.focus_right()
-            elif key == Qt.Key.Key_Left:
-                handled = self.focus_left()
-            elif key == Qt.Key.Key_Down:
-                handled = self.focus_down()
-            elif key == Qt.Key.Key_Up:
-                handled = self.focus_up()
-            
-            if handled:
-                event.accept()
-                return
+        handler = self._nav.get(event.key())
+        if handler is not None and handler():
+            event.accept()
+            return
         
         # Default: let parent handle
         super().keyPressEvent(event)
@@ -587,12 +830,8 @@ class MediaGrid(QWidget):
         Args:
             event: Close event
         """
-        # Cleanup all workers before closing
-        for worker in list(self.thumbnail_workers.values()):
-            worker.cleanup()
-            # Note: PySide6 automatically cleans up signals when objects are deleted
-            worker.deleteLater()
-        self.thumbnail_workers.clear()
+        # Cancel pending thumbnail tasks before closing
+        self._cancel_all_thumbnails()
         super().closeEvent(event)
 
 
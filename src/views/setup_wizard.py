@@ -1,15 +1,17 @@
 """Setup wizard for initial folder configuration."""
 
+import os
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import QThread, Signal, Qt
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QThread, Signal, Qt
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
+    QListView,
     QPushButton,
     QProgressBar,
     QMessageBox,
@@ -27,6 +29,8 @@ class ScanWorker(QThread):
     completed = Signal(int)  # total_files
     error = Signal(str)  # error_message
 
+    PROGRESS_INTERVAL = 0.033  # Seconds between progress updates (~30 Hz)
+
     def __init__(
         self,
         folder_paths: List[str],
@@ -42,9 +46,10 @@ class ScanWorker(QThread):
         self.folder_paths = folder_paths
         self.database = database
         self.scanner: Optional[MediaScanner] = None
+        self._last_progress = 0.0  # time.monotonic() of the last progress emit
 
     def run(self) -> None:
-        """Run the scanner."""
+        """Run the scanner on this worker thread."""
         try:
             self.scanner = MediaScanner(
                 self.folder_paths,
@@ -52,8 +57,9 @@ class ScanWorker(QThread):
                 progress_callback=self._on_progress,
                 completed_callback=self._on_completed,
             )
-            self.scanner.start()
-            self.scanner.join()
+            # Already on a worker thread: run the scan here rather than
+            # starting the scanner's own thread just to wait for it
+            self.scanner.run()
         except Exception as e:
             self.error.emit(str(e))
 
@@ -65,6 +71,12 @@ class ScanWorker(QThread):
             total: Total files
             current_file: Current file path
         """
+        # Rate limit per-file updates so a fast scan doesn't flood the UI
+        # thread; the final update (no current file) always goes through
+        now = time.monotonic()
+        if current_file and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
         self.progress.emit(current, total, current_file)
 
     def _on_completed(self, total_files: int) -> None:
@@ -81,6 +93,68 @@ class ScanWorker(QThread):
             self.scanner.stop()
 
 
+class FolderListModel(QAbstractListModel):
+    """List model over the wizard's selected folders."""
+
+    def __init__(self, folder_paths: Dict[str, None], parent=None):
+        """Initialize folder list model.
+
+        Args:
+            folder_paths: Insertion-ordered set of folders, updated in place
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._folder_paths = folder_paths
+        self._rows: List[str] = list(folder_paths)  # Row order, for O(1) lookup
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of folders (the list has no children)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Folder path for display.
+
+        Args:
+            index: Row to read
+            role: Item data role
+
+        Returns:
+            Folder path, or None for other roles
+        """
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()]
+        return None
+
+    def add_folder(self, folder_path: str) -> bool:
+        """Append a folder unless it's already listed.
+
+        Args:
+            folder_path: Folder to add
+
+        Returns:
+            True if the folder was added
+        """
+        if folder_path in self._folder_paths:
+            return False
+
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._folder_paths[folder_path] = None
+        self._rows.append(folder_path)
+        self.endInsertRows()
+        return True
+
+    def remove_row(self, row: int) -> None:
+        """Remove the folder at a row.
+
+        Args:
+            row: Row to remove
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._folder_paths.pop(self._rows.pop(row), None)
+        self.endRemoveRows()
+
+
 class SetupWizard(QDialog):
     """Setup wizard dialog for folder selection and initial scan."""
 
@@ -93,8 +167,9 @@ class SetupWizard(QDialog):
         """
         super().__init__(parent)
         self.database = database
-        self.folder_paths: List[str] = []
+        self.folder_paths: Dict[str, None] = {}  # Insertion-ordered set of folders
         self.scan_worker: Optional[ScanWorker] = None
+        self._closing = False  # Scan cancelled by closing; close once it stops
 
         self.setWindowTitle("Videoteka - Initial Setup")
         self.setMinimumSize(600, 500)
@@ -121,7 +196,9 @@ class SetupWizard(QDialog):
         list_label = QLabel("Selected folders:")
         layout.addWidget(list_label)
 
-        self.folder_list = QListWidget()
+        self.folder_model = FolderListModel(self.folder_paths, self)
+        self.folder_list = QListView()
+        self.folder_list.setModel(self.folder_model)
         layout.addWidget(self.folder_list)
 
         # Buttons for folder management
@@ -165,18 +242,13 @@ class SetupWizard(QDialog):
             self, "Select Folder with Multimedia Files"
         )
         if folder:
-            folder_path = str(Path(folder).resolve())
-            if folder_path not in self.folder_paths:
-                self.folder_paths.append(folder_path)
-                self.folder_list.addItem(folder_path)
+            self.folder_model.add_folder(str(Path(folder).resolve()))
 
     def _remove_folder(self) -> None:
         """Remove selected folder from list."""
-        current_item = self.folder_list.currentItem()
-        if current_item:
-            folder_path = current_item.text()
-            self.folder_paths.remove(folder_path)
-            self.folder_list.takeItem(self.folder_list.row(current_item))
+        current = self.folder_list.currentIndex()
+        if current.isValid():
+            self.folder_model.remove_row(current.row())
 
     def _confirm_and_scan(self) -> None:
         """Confirm folder selection and start scanning."""
@@ -200,7 +272,7 @@ class SetupWizard(QDialog):
         self.progress_label.setText("Starting scan...")
 
         # Start scan worker
-        self.scan_worker = ScanWorker(self.folder_paths, self.database)
+        self.scan_worker = ScanWorker(list(self.folder_paths), self.database)
         self.scan_worker.progress.connect(self._on_scan_progress)
         self.scan_worker.completed.connect(self._on_scan_completed)
         self.scan_worker.error.connect(self._on_scan_error)
@@ -218,7 +290,7 @@ class SetupWizard(QDialog):
             self.progress_bar.setMaximum(total)
             self.progress_bar.setValue(current)
             self.progress_label.setText(
-                f"Processando: {current}/{total}\n{Path(current_file).name if current_file else ''}"
+                f"Processando: {current}/{total}\n{os.path.basename(current_file)}"
             )
 
     def _on_scan_completed(self, total_files: int) -> None:
@@ -227,6 +299,9 @@ class SetupWizard(QDialog):
         Args:
             total_files: Total files processed
         """
+        if self._closing:
+            return  # Cancelled scan; the dialog closes when the thread finishes
+
         self.progress_bar.setValue(self.progress_bar.maximum())
         self.progress_label.setText(f"Scan completed! {total_files} files found.")
         QMessageBox.information(
@@ -242,6 +317,9 @@ class SetupWizard(QDialog):
         Args:
             error_message: Error message
         """
+        if self._closing:
+            return
+
         QMessageBox.critical(self, "Error", f"Error during scan:\n{error_message}")
         self._reset_ui()
 
@@ -255,21 +333,34 @@ class SetupWizard(QDialog):
         self.progress_label.setVisible(False)
 
     def closeEvent(self, event) -> None:
-        """Handle close event."""
+        """Handle close event.
+
+        A running scan is asked to stop and the dialog closes once its thread
+        finishes, instead of blocking the event loop waiting for it.
+        """
         if self.scan_worker and self.scan_worker.isRunning():
+            event.ignore()
+            if self._closing:
+                return  # Already cancelling
+
             reply = QMessageBox.question(
                 self,
                 "Confirm",
                 "Scanning is in progress. Do you really want to cancel?",
                 QMessageBox.Yes | QMessageBox.No,
             )
-            if reply == QMessageBox.Yes:
+            if reply == QMessageBox.Yes and self.scan_worker.isRunning():
+                self._closing = True
+                self.progress_label.setText("Cancelling scan...")
+                self.scan_worker.finished.connect(self._finish_close)
                 self.scan_worker.stop_scan()
-                self.scan_worker.wait()
-                event.accept()
-            else:
-                event.ignore()
+            elif reply == QMessageBox.Yes:
+                event.accept()  # The scan ended while the question was open
         else:
             event.accept()
 
+    def _finish_close(self) -> None:
+        """Close the dialog once a cancelled scan has stopped."""
+        self.reject()
+
 
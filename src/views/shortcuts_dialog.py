@@ -1,5 +1,7 @@
 """Dialog showing keyboard shortcuts."""
 
+from html import escape
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QDialog,
@@ -9,11 +11,85 @@ from PySide6.QtWidgets import (
     QPushButton,
     QCheckBox,
     QScrollArea,
-    QWidget,
-    QGridLayout,
 )
 
 
+# Shortcuts by category
+_SHORTCUTS = {
+    "Grid Navigation": [
+        ("← →", "Navigate between columns"),
+        ("↑ ↓", "Navigate between rows"),
+        ("PgUp PgDn", "Move one page of rows"),
+        ("Home", "Go to first item"),
+        ("End", "Go to last item"),
+    ],
+    "Actions": [
+        ("Enter", "Open selected file"),
+        ("Esc", "Close dialogs / Return to grid"),
+    ],
+    "Panel Navigation": [
+        ("C", "Focus categories panel"),
+        ("G", "Focus files grid"),
+    ],
+    "Categories": [
+        ("↑ ↓", "Navigate between categories"),
+        ("Enter", "Select category"),
+    ],
+}
+
+
+def _build_shortcuts_html() -> str:
+    """Render the shortcuts as one rich text table.
+
+    Returns:
+        HTML table with a header row per category
+    """
+    rows = []
+    for category, items in _SHORTCUTS.items():
+        rows.append(
+            '<tr><td colspan="2" style="font-size: 14px; font-weight: bold; '
+            f'color: #0078d4; padding-top: 10px;">{escape(category)}</td></tr>'
+        )
+        for shortcut, description in items:
+            rows.append(
+                f'<tr><td width="150" style="color: #ffffff;"><b>{escape(shortcut)}</b></td>'
+                f'<td style="color: #cccccc;">{escape(description)}</td></tr>'
+            )
+    return '<table cellspacing="0" cellpadding="5">' + "".join(rows) + "</table>"
+
+
+# The content is static, so it's rendered to a single label once per process
+_SHORTCUTS_HTML = _build_shortcuts_html()
+
+_STYLE = """
+    QDialog {
+        background-color: #1a1a1a;
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #2a2a2a;
+        border: 1px solid #444444;
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: #ffffff;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #333333;
+    }
+    QPushButton:pressed {
+        background-color: #1a1a1a;
+    }
+    QCheckBox {
+        color: #ffffff;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+"""
+
+
 class ShortcutsDialog(QDialog):
     """Dialog displaying all keyboard shortcuts."""
 
@@ -43,57 +119,13 @@ class ShortcutsDialog(QDialog):
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("background-color: #1a1a1a; border: none;")
 
-        scroll_widget = QWidget()
-        scroll_layout = QGridLayout(scroll_widget)
-        scroll_layout.setSpacing(10)
-        scroll_layout.setContentsMargins(20, 20, 20, 20)
-
-        # Define shortcuts by category
-        shortcuts = {
-            "Grid Navigation": [
-                ("← →", "Navigate between columns"),
-                ("↑ ↓", "Navigate between rows"),
-                ("Home", "Go to first item"),
-                ("End", "Go to last item"),
-            ],
-            "Actions": [
-                ("Enter", "Open selected file"),
-                ("Esc", "Close dialogs / Return to grid"),
-            ],
-            "Panel Navigation": [
-                ("C", "Focus categories panel"),
-                ("G", "Focus files grid"),
-            ],
-            "Categories": [
-                ("↑ ↓", "Navigate between categories"),
-                ("Enter", "Select category"),
-            ],
-        }
-
-        row = 0
-        for category, items in shortcuts.items():
-            # Category header
-            cat_label = QLabel(category)
-            cat_label.setStyleSheet(
-                "font-size: 14px; font-weight: bold; color: #0078d4; margin-top: 10px;"
-            )
-            scroll_layout.addWidget(cat_label, row, 0, 1, 2)
-            row += 1
-
-            # Shortcuts in this category
-            for shortcut, description in items:
-                shortcut_label = QLabel(f"<b>{shortcut}</b>")
-                shortcut_label.setStyleSheet("color: #ffffff; padding: 5px;")
-                shortcut_label.setMinimumWidth(150)
-
-                desc_label = QLabel(description)
-                desc_label.setStyleSheet("color: #cccccc; padding: 5px;")
+        # All shortcuts in one rich text label instead of a label per cell
+        shortcuts_label = QLabel(_SHORTCUTS_HTML)
+        shortcuts_label.setTextFormat(Qt.TextFormat.RichText)
+        shortcuts_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        shortcuts_label.setContentsMargins(20, 20, 20, 20)
 
-                scroll_layout.addWidget(shortcut_label, row, 0)
-                scroll_layout.addWidget(desc_label, row, 1)
-                row += 1
-
-        scroll.setWidget(scroll_widget)
+        scroll.setWidget(shortcuts_label)
         layout.addWidget(scroll)
 
         # Don't show again checkbox
@@ -112,35 +144,7 @@ class ShortcutsDialog(QDialog):
         layout.addLayout(button_layout)
 
         # Set dialog style
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #1a1a1a;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #2a2a2a;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #ffffff;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #333333;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-            QCheckBox {
-                color: #ffffff;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            """
-        )
+        self.setStyleSheet(_STYLE)
 
     def should_show_again(self) -> bool:
         """Check if dialog should be shown again.
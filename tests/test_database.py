@@ -56,6 +56,30 @@ class TestDatabase(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result["file_name"], "video.mp4")
 
+    def test_add_media_files(self):
+        """Test adding media files in a single transaction."""
+        media_files = [
+            MediaFile(
+                file_path=f"/test/video{i}.mp4",
+                file_name=f"video{i}.mp4",
+                file_type=MediaType.VIDEO,
+                folder_path="/test",
+            )
+            for i in range(500)
+        ]
+
+        statements = []
+        conn = self.database._get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            added = self.database.add_media_files(media_files)
+        finally:
+            conn.set_trace_callback(None)
+
+        self.assertEqual(added, 500)
+        self.assertEqual(self.database.get_media_count(), 500)
+        self.assertEqual(statements.count("COMMIT"), 1)
+
     def test_get_media_files(self):
         """Test getting media files."""
         # Add test files
@@ -75,6 +99,42 @@ class TestDatabase(unittest.TestCase):
         video_files = self.database.get_media_files(file_type="video")
         self.assertEqual(len(video_files), 5)
 
+    def test_get_media_files_pagination(self):
+        """Test paging through media files."""
+        for i in range(5):
+            self.database.add_media_file(
+                MediaFile(
+                    file_path=f"/test/file{i}.mp4",
+                    file_name=f"file{i}.mp4",
+                    file_type=MediaType.VIDEO,
+                )
+            )
+
+        page = self.database.get_media_files(limit=2, offset=1)
+        self.assertEqual([f["file_name"] for f in page], ["file1.mp4", "file2.mp4"])
+
+        # Offset alone returns the rest
+        rest = self.database.get_media_files(offset=3)
+        self.assertEqual([f["file_name"] for f in rest], ["file3.mp4", "file4.mp4"])
+
+    def test_get_file_signatures(self):
+        """Test reading back stored file identities."""
+        self.database.add_media_file(
+            MediaFile(
+                file_path="/test/video.mp4",
+                file_type=MediaType.VIDEO,
+                inode=42,
+                mtime_ns=1700000000000000000,
+            )
+        )
+        # Files stored without an identity are left out
+        self.database.add_media_file(
+            MediaFile(file_path="/test/other.mp4", file_type=MediaType.VIDEO)
+        )
+
+        signatures = self.database.get_file_signatures()
+        self.assertEqual(signatures, {"/test/video.mp4": (42, 1700000000000000000)})
+
     def test_add_folder(self):
         """Test adding folder."""
         folder_id = self.database.add_folder("/test/folder")
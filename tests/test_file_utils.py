@@ -70,6 +70,9 @@ class TestFileUtils(unittest.TestCase):
         finally:
             os.unlink(temp_path)
 
+        # Missing files have no metadata
+        self.assertEqual(get_file_metadata(temp_path), {})
+
 
 if __name__ == "__main__":
     unittest.main()
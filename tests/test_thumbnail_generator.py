@@ -4,8 +4,12 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
+from unittest import mock
+
+import pytest
 from PIL import Image
 
+from src.utils import thumbnail_generator
 from src.utils.thumbnail_generator import ThumbnailGenerator
 
 
@@ -29,6 +33,32 @@ class TestThumbnailGenerator(unittest.TestCase):
         self.assertIsNotNone(cache_path)
         self.assertTrue(str(cache_path).endswith(".jpg"))
 
+        # Same path, same name; different paths, different names
+        self.assertEqual(cache_path, self.generator._get_cache_path("/test/file.mp4"))
+        self.assertNotEqual(cache_path, self.generator._get_cache_path("/test/other.mp4"))
+
+    def test_cached_thumbnail_skips_generation(self):
+        """Test an unchanged file is served from cache without decoding."""
+        test_image_path = os.path.join(self.temp_dir, "test.jpg")
+        Image.new("RGB", (800, 600), color="red").save(test_image_path)
+
+        calls = []
+        original = self.generator._generate_image_thumbnail
+
+        def counting(file_path):
+            calls.append(file_path)
+            return original(file_path)
+
+        self.generator._generate_image_thumbnail = counting
+        # Decodes are counted on the PIL backend, whichever one is installed
+        with mock.patch.object(thumbnail_generator, "_pyvips", None):
+            first = self.generator.generate_thumbnail(test_image_path, "image")
+            second = self.generator.generate_thumbnail(test_image_path, "image")
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.generator.get_thumbnail_path(test_image_path), first)
+
     def test_generate_image_thumbnail(self):
         """Test generating thumbnail from image."""
         # Create a test image
@@ -40,6 +70,78 @@ class TestThumbnailGenerator(unittest.TestCase):
         self.assertIsNotNone(thumbnail)
         self.assertIsInstance(thumbnail, Image.Image)
 
+    def test_modified_file_regenerates_thumbnail(self):
+        """Test a stale cached thumbnail isn't served for an edited file."""
+        test_image_path = os.path.join(self.temp_dir, "test.jpg")
+        Image.new("RGB", (800, 600), color="red").save(test_image_path)
+        first = self.generator.generate_thumbnail(test_image_path, "image")
+
+        Image.new("RGB", (800, 600), color="blue").save(test_image_path)
+        stat = os.stat(test_image_path)
+        os.utime(test_image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(self.generator.get_thumbnail_path(test_image_path))
+
+        # Regenerated in place, so edits don't leave old thumbnails behind
+        second = self.generator.generate_thumbnail(test_image_path, "image")
+        self.assertEqual(first, second)
+        self.assertEqual(len(list(Path(self.cache_dir).glob("*.jpg"))), 1)
+        with Image.open(second) as thumbnail:
+            red, green, blue = thumbnail.convert("RGB").getpixel((10, 10))
+            self.assertGreater(blue, red)
+
+    def test_replaced_file_with_older_mtime_regenerates_thumbnail(self):
+        """Test a file replaced by an older, different-sized copy gets a new thumbnail."""
+        test_image_path = os.path.join(self.temp_dir, "test.jpg")
+        Image.new("RGB", (800, 600), color="red").save(test_image_path)
+        first = self.generator.generate_thumbnail(test_image_path, "image")
+        old_stat = os.stat(test_image_path)
+
+        # Like `mv`/`cp -p` of an older copy: new inode, earlier mtime, other size
+        replacement_path = os.path.join(self.temp_dir, "replacement.jpg")
+        Image.new("RGB", (400, 300), color="blue").save(replacement_path)
+        older = old_stat.st_mtime_ns - 3600 * 1_000_000_000
+        os.utime(replacement_path, ns=(older, older))
+        os.replace(replacement_path, test_image_path)
+        self.assertNotEqual(os.stat(test_image_path).st_size, old_stat.st_size)
+        self.assertIsNone(self.generator.get_thumbnail_path(test_image_path))
+
+        second = self.generator.generate_thumbnail(test_image_path, "image")
+        self.assertEqual(first, second)
+        with Image.open(second) as thumbnail:
+            red, green, blue = thumbnail.convert("RGB").getpixel((10, 10))
+            self.assertGreater(blue, red)
+
+    def _check_thumbnail_fits_and_flattens(self):
+        """Generate an RGBA image's thumbnail and check its size and colours."""
+        test_image_path = os.path.join(self.temp_dir, "test.png")
+        Image.new("RGBA", (800, 600), color=(255, 0, 0, 128)).save(test_image_path)
+
+        thumbnail_path = self.generator.generate_thumbnail(test_image_path, "image")
+        self.assertIsNotNone(thumbnail_path)
+        with Image.open(thumbnail_path) as thumbnail:
+            self.assertEqual(thumbnail.format, "JPEG")
+            self.assertEqual(thumbnail.mode, "RGB")
+            # 4:3 source into 300x200: height bound, width rounded either way
+            width, height = thumbnail.size
+            self.assertEqual(height, 200)
+            self.assertIn(width, (266, 267))
+            # Half-transparent red over white, not over black
+            red, green, blue = thumbnail.getpixel((width // 2, height // 2))
+            self.assertGreater(red, 240)
+            self.assertTrue(100 < green < 160 and 100 < blue < 160)
+
+    def test_generate_thumbnail_fits_size_pil(self):
+        """Test the PIL backend scales down and flattens image thumbnails."""
+        with mock.patch.object(thumbnail_generator, "_pyvips", None):
+            self._check_thumbnail_fits_and_flattens()
+
+    def test_generate_thumbnail_fits_size_vips(self):
+        """Test the libvips backend scales down and flattens image thumbnails."""
+        pytest.importorskip("pyvips")
+        # Fail the PIL fallback so only a libvips thumbnail can pass
+        with mock.patch.object(self.generator, "_generate_image_thumbnail", return_value=None):
+            self._check_thumbnail_fits_and_flattens()
+
     def test_generate_audio_thumbnail(self):
         """Test generating default audio thumbnail."""
         test_audio_path = "/test/audio.mp3"